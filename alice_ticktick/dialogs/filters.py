@@ -6,21 +6,28 @@ from typing import TYPE_CHECKING, Any
 
 from aliceio.filters.base import Filter
 
+from alice_ticktick.dialogs.middlewares import get_nlu_intents
+
 if TYPE_CHECKING:
+    from collections.abc import Iterable, Mapping
+
     from aliceio.types import Message
 
 
 class IntentFilter(Filter):
-    """Match messages that contain a specific NLU intent."""
+    """Match messages that contain a specific NLU intent.
+
+    Uses ``nlu_intents`` from NluIntentsMiddleware when it is installed.
+    """
 
     def __init__(self, intent_id: str) -> None:
         self.intent_id = intent_id
 
-    async def __call__(self, message: Message) -> bool | dict[str, Any]:
-        if message.nlu is None:
-            return False
-        intent_data = message.nlu.intents.get(self.intent_id)
-        if intent_data is None:
+    async def __call__(
+        self, message: Message, nlu_intents: Mapping[str, Any] | None = None
+    ) -> bool | dict[str, Any]:
+        nlu_intents = get_nlu_intents(message, nlu_intents)
+        if (intent_data := nlu_intents.get(self.intent_id)) is None:
             return False
         return {"intent_data": intent_data}
 
@@ -28,6 +35,34 @@ class IntentFilter(Filter):
         return self._signature_to_string(self.intent_id)
 
 
+class IntentDispatchFilter(Filter):
+    """Match the highest-priority NLU intent out of a known set.
+
+    *priority* lists intent ids from highest to lowest priority. The matched id and
+    its data are passed to the handler as ``intent_name`` and ``intent_data``.
+    """
+
+    def __init__(self, priority: Iterable[str]) -> None:
+        self.rank = {intent_id: i for i, intent_id in enumerate(priority)}
+
+    async def __call__(
+        self, message: Message, nlu_intents: Mapping[str, Any] | None = None
+    ) -> bool | dict[str, Any]:
+        nlu_intents = get_nlu_intents(message, nlu_intents)
+        best_id: str | None = None
+        best_rank = len(self.rank)
+        for intent_id in nlu_intents:
+            rank = self.rank.get(intent_id, best_rank)
+            if rank < best_rank:
+                best_id, best_rank = intent_id, rank
+        if best_id is None:
+            return False
+        return {"intent_name": best_id, "intent_data": nlu_intents[best_id]}
+
+    def __repr__(self) -> str:
+        return f"IntentDispatchFilter({len(self.rank)} intents)"
+
+
 class NewSessionFilter(Filter):
     """Match new session messages (session.new is True)."""
 
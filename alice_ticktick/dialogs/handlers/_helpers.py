@@ -16,8 +16,11 @@ from aliceio.types import Directives, Response, Update
 from alice_ticktick.dialogs import responses as txt
 from alice_ticktick.dialogs.nlp import DateRange, find_best_match, find_matches
 from alice_ticktick.dialogs.nlp.date_parser import ExtractedDates, extract_dates_from_nlu
+from alice_ticktick.ticktick.models import format_ticktick_datetime
 
 if TYPE_CHECKING:
+    from collections.abc import Awaitable
+
     from aliceio.types import Message
 
     from alice_ticktick.ticktick.client import TickTickClient
@@ -359,42 +362,33 @@ async def _gather_all_tasks_impl(client: TickTickClient, access_token: str) -> l
 
     proj_entry = _projects_cache.get(access_token)
     now = time.monotonic()
+    inbox: Awaitable[list[Task]]
     if proj_entry is not None and now - proj_entry[0] < _PROJECT_CACHE_TTL:
         projects = proj_entry[1]
         age = now - proj_entry[0]
         logger.info("Using cached projects (%d), age %.1fs", len(projects), age)
+        inbox = client.get_inbox_tasks()
     else:
-        projects_result, inbox_tasks = await asyncio.gather(
-            client.get_projects(),
-            client.get_inbox_tasks(),
-        )
-        projects = projects_result
+        # Cold path: start the inbox fetch right away and overlap it with the project
+        # list and the per-project fan-out, instead of waiting for both before fan-out
+        inbox_future = asyncio.ensure_future(client.get_inbox_tasks())
+        try:
+            projects = await client.get_projects()
+        except BaseException:
+            if not inbox_future.cancel() and not inbox_future.cancelled():
+                # Already finished: mark its outcome retrieved so a failure is not reported
+                inbox_future.exception()
+            raise
         _projects_cache[access_token] = (time.monotonic(), projects)
         elapsed = (time.monotonic() - t0) * 1000
-        logger.info("Fetched projects (%d) + inbox in %.0fms", len(projects), elapsed)
-
-        if projects:
-            project_task_lists = await asyncio.gather(
-                *(client.get_tasks(p.id) for p in projects),
-            )
-            all_tasks = list(inbox_tasks)
-            for tasks in project_task_lists:
-                all_tasks.extend(tasks)
-        else:
-            all_tasks = list(inbox_tasks)
+        logger.info("Fetched projects (%d) in %.0fms", len(projects), elapsed)
+        inbox = inbox_future
 
-        elapsed = (time.monotonic() - t0) * 1000
-        logger.info("Total _gather_all_tasks: %.0fms, %d tasks", elapsed, len(all_tasks))
-        return all_tasks
-
-    # Warm path: projects cached, fetch inbox + project tasks all in parallel
-    task_lists = await asyncio.gather(
-        client.get_inbox_tasks(),
-        *(client.get_tasks(p.id) for p in projects),
-    )
+    # gather() retrieves the outcome of every awaitable, even after an early failure
+    task_lists = await asyncio.gather(inbox, *(client.get_tasks(p.id) for p in projects))
     all_tasks = [t for tasks in task_lists for t in tasks]
     elapsed = (time.monotonic() - t0) * 1000
-    logger.info("Total _gather_all_tasks (cached): %.0fms, %d tasks", elapsed, len(all_tasks))
+    logger.info("Total _gather_all_tasks: %.0fms, %d tasks", elapsed, len(all_tasks))
     return all_tasks
 
 
@@ -407,7 +401,7 @@ def _get_access_token(message: Message) -> str | None:
 
 def _format_ticktick_dt(dt: datetime.datetime) -> str:
     """Format datetime for TickTick API with proper timezone offset."""
-    return dt.strftime("%Y-%m-%dT%H:%M:%S.000%z")
+    return format_ticktick_datetime(dt)
 
 
 _WEEKDAY_MAP: dict[str, int] = {
@@ -452,8 +446,13 @@ def _try_parse_weekday(raw: str, tz: ZoneInfo) -> datetime.date | None:
     return today + datetime.timedelta(days=days_ahead)
 
 
-def _extract_nlu_dates(message: Message, tz: ZoneInfo) -> ExtractedDates | None:
-    """Try to extract dates from NLU entities (hybrid approach)."""
+def _extract_nlu_dates(
+    message: Message, tz: ZoneInfo, now: datetime.datetime | None = None
+) -> ExtractedDates | None:
+    """Try to extract dates from NLU entities (hybrid approach).
+
+    *now* lets the caller share one clock reading across a request.
+    """
     if not message.nlu:
         return None
     # Count command tokens: "создай задачу" = 2, "создай" = 1, etc.
@@ -464,7 +463,8 @@ def _extract_nlu_dates(message: Message, tz: ZoneInfo) -> ExtractedDates | None:
     cmd_count = 1
     if len(tokens) > 1 and tokens[1] in filler:
         cmd_count = 2
-    now = datetime.datetime.now(tz=tz)
+    if now is None:
+        now = datetime.datetime.now(tz=tz)
     result = extract_dates_from_nlu(message.nlu, command_token_count=cmd_count, now=now)
     if result.start_date is None:
         return None
@@ -6,6 +6,7 @@ import logging
 from typing import TYPE_CHECKING, Any
 
 from aliceio.types import Response, Update
+from pydantic import TypeAdapter
 
 from alice_ticktick.dialogs import responses as txt
 from alice_ticktick.dialogs.intents import (
@@ -16,7 +17,7 @@ from alice_ticktick.dialogs.intents import (
 )
 from alice_ticktick.dialogs.nlp import find_best_match
 from alice_ticktick.ticktick.client import TickTickClient, TickTickUnauthorizedError
-from alice_ticktick.ticktick.models import TaskUpdate
+from alice_ticktick.ticktick.models import ChecklistItem, TaskUpdate
 
 from ._helpers import (
     _auth_required_response,
@@ -31,6 +32,9 @@ if TYPE_CHECKING:
 
 logger = logging.getLogger(__name__)
 
+# Dumps a whole checklist to API dicts (id, title, status, sortOrder) in one call
+_CHECKLIST_ITEMS = TypeAdapter(list[ChecklistItem])
+
 
 async def handle_add_checklist_item(
     message: Message,
@@ -61,21 +65,15 @@ async def handle_add_checklist_item(
             matched_task = result.task
 
             # Build updated items list
-            existing_items: list[dict[str, Any]] = [
-                {
-                    "id": item.id,
-                    "title": item.title,
-                    "status": item.status,
-                    "sortOrder": item.sort_order,
-                }
-                for item in matched_task.items
-            ]
+            existing_items: list[dict[str, Any]] = _CHECKLIST_ITEMS.dump_python(
+                matched_task.items, by_alias=True
+            )
             new_item: dict[str, Any] = {"title": slots.item_name, "status": 0}
             updated_items = [*existing_items, new_item]
 
             payload = TaskUpdate(
                 id=matched_task.id,
-                projectId=matched_task.project_id,
+                project_id=matched_task.project_id,
                 items=updated_items,
             )
             await client.update_task(payload)
@@ -185,19 +183,14 @@ async def handle_check_item(
             matched_item_title, item_idx = item_match
 
             # Build updated items list with matched item checked
-            updated_items: list[dict[str, Any]] = []
-            for i, item in enumerate(matched_task.items):
-                item_dict: dict[str, Any] = {
-                    "id": item.id,
-                    "title": item.title,
-                    "status": 1 if i == item_idx else item.status,
-                    "sortOrder": item.sort_order,
-                }
-                updated_items.append(item_dict)
+            updated_items: list[dict[str, Any]] = _CHECKLIST_ITEMS.dump_python(
+                matched_task.items, by_alias=True
+            )
+            updated_items[item_idx]["status"] = 1
 
             payload = TaskUpdate(
                 id=matched_task.id,
-                projectId=matched_task.project_id,
+                project_id=matched_task.project_id,
                 items=updated_items,
             )
             await client.update_task(payload)
@@ -262,20 +255,14 @@ async def handle_delete_checklist_item(
             matched_item_title, item_idx = item_match
 
             # Build updated items list without the matched item
-            updated_items: list[dict[str, Any]] = [
-                {
-                    "id": item.id,
-                    "title": item.title,
-                    "status": item.status,
-                    "sortOrder": item.sort_order,
-                }
-                for i, item in enumerate(matched_task.items)
-                if i != item_idx
-            ]
+            updated_items: list[dict[str, Any]] = _CHECKLIST_ITEMS.dump_python(
+                [*matched_task.items[:item_idx], *matched_task.items[item_idx + 1 :]],
+                by_alias=True,
+            )
 
             payload = TaskUpdate(
                 id=matched_task.id,
-                projectId=matched_task.project_id,
+                project_id=matched_task.project_id,
                 items=updated_items,
             )
             await client.update_task(payload)
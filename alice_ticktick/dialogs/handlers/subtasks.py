@@ -57,8 +57,8 @@ async def handle_add_subtask(
 
             payload = TaskCreate(
                 title=slots.subtask_name,
-                projectId=result.task.project_id,
-                parentId=result.task.id,
+                project_id=result.task.project_id,
+                parent_id=result.task.id,
             )
             await client.create_task(payload)
             _invalidate_task_cache(access_token)
@@ -72,6 +72,9 @@ logger = logging.getLogger(__name__)
 
 _INBOX_NAMES: Final[frozenset[str]] = frozenset({"inbox", "входящие", "инбокс"})
 
+# Plain dict lookup instead of the IntEnum constructor for parsed priority values
+_PRIORITY_BY_VALUE: Final[dict[int, TaskPriority]] = {p.value: p for p in TaskPriority}
+
 # TickTick API Inbox pseudo-project ID
 # (empirically verified; used in move_task and /project/inbox/data)
 _INBOX_PROJECT_ID: Final[str] = "inbox"
@@ -203,6 +206,8 @@ async def handle_create_task(
         return Response(text=txt.TASK_NAME_REQUIRED)
 
     user_tz = _get_user_tz(event_update)
+    # One clock reading shared by every date parsed for this request
+    now_local = datetime.datetime.now(tz=user_tz)
     start_date_str: str | None = None
     due_date_str: str | None = None
     is_all_day: bool | None = None
@@ -222,7 +227,7 @@ async def handle_create_task(
 
     # Hybrid approach: try NLU entities first for better date extraction,
     # fall back to grammar slots.
-    nlu_dates = _extract_nlu_dates(message, user_tz)
+    nlu_dates = _extract_nlu_dates(message, user_tz, now_local)
 
     # Duration without date -> ask for start time
     if duration and not slots.date and (not nlu_dates or not nlu_dates.start_date):
@@ -261,7 +266,6 @@ async def handle_create_task(
             start_date_str = None
     elif slots.date:
         # Fallback: grammar-based date extraction
-        now_local = datetime.datetime.now(tz=user_tz)
         try:
             parsed_date = parse_yandex_datetime(slots.date, now=now_local)
             if isinstance(parsed_date, datetime.datetime):
@@ -281,7 +285,6 @@ async def handle_create_task(
     end_time_display: str | None = None
 
     if slots.range_start and slots.range_end:
-        now_local = datetime.datetime.now(tz=user_tz)
         try:
             parsed_rs = parse_yandex_datetime(slots.range_start, now=now_local)
             parsed_re = parse_yandex_datetime(slots.range_end, now=now_local)
@@ -311,7 +314,6 @@ async def handle_create_task(
         ):
             start_dt = nlu_dates.start_date
         elif slots.date:
-            now_local = datetime.datetime.now(tz=user_tz)
             parsed = parse_yandex_datetime(slots.date, now=now_local)
             start_dt = (
                 parsed
@@ -333,7 +335,7 @@ async def handle_create_task(
 
     # Parse optional priority
     priority_raw = parse_priority(slots.priority) or 0
-    priority_value = TaskPriority(priority_raw)
+    priority_value = _PRIORITY_BY_VALUE[priority_raw]
 
     # Parse recurrence -- fallback: check tokens if NLU didn't fill rec_freq
     _tokens = message.nlu.tokens if message.nlu else None
@@ -373,12 +375,12 @@ async def handle_create_task(
 
             payload = TaskCreate(
                 title=task_name,
-                projectId=project_id,
+                project_id=project_id,
                 priority=priority_value,
-                startDate=start_date_str,
-                dueDate=due_date_str,
-                isAllDay=is_all_day,
-                repeatFlag=repeat_flag,
+                start_date=start_date_str,
+                due_date=due_date_str,
+                is_all_day=is_all_day,
+                repeat_flag=repeat_flag,
                 reminders=reminders_list,
             )
             await client.create_task(payload)
@@ -487,7 +489,7 @@ async def handle_add_reminder(
 
             payload = TaskUpdate(
                 id=matched_task.id,
-                projectId=matched_task.project_id,
+                project_id=matched_task.project_id,
                 reminders=existing_reminders,
             )
             await client.update_task(payload)
@@ -918,7 +920,7 @@ async def handle_edit_task(
     # Hybrid approach: try NLU entities for date extraction (grammar .+ swallows dates)
     user_tz = _get_user_tz(event_update)
     now_local = datetime.datetime.now(tz=user_tz)
-    nlu_dates = _extract_nlu_dates(message, user_tz)
+    nlu_dates = _extract_nlu_dates(message, user_tz, now_local)
     nlu_has_date = nlu_dates is not None and nlu_dates.start_date is not None
 
     # Defence: grammar "(в $NewName)?" splits task names containing "в"
@@ -1109,7 +1111,7 @@ async def handle_edit_task(
     if has_priority:
         raw = parse_priority(slots.new_priority)
         if raw is not None:
-            new_priority_value = TaskPriority(raw)
+            new_priority_value = _PRIORITY_BY_VALUE[raw]
         else:
             logger.warning("Unrecognized priority value: %s", slots.new_priority)
 
@@ -1196,13 +1198,13 @@ async def handle_edit_task(
     if has_other_changes:
         update_payload = TaskUpdate(
             id=matched_task.id,
-            projectId=effective_target_project_id or matched_task.project_id,
+            project_id=effective_target_project_id or matched_task.project_id,
             title=new_title,
             priority=new_priority_value,
-            startDate=new_start_date,
-            dueDate=new_due_date,
-            isAllDay=new_is_all_day,
-            repeatFlag=new_repeat_flag,
+            start_date=new_start_date,
+            due_date=new_due_date,
+            is_all_day=new_is_all_day,
+            repeat_flag=new_repeat_flag,
             reminders=new_reminders,
         )
     if wants_move and effective_target_project_id is not None:
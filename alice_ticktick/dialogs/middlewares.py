@@ -0,0 +1,36 @@
+"""Custom aliceio middlewares."""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Any
+
+from aliceio import BaseMiddleware
+from aliceio.types import Message
+
+if TYPE_CHECKING:
+    from collections.abc import Awaitable, Callable, Mapping
+
+
+def get_nlu_intents(
+    message: Message, nlu_intents: Mapping[str, Any] | None = None
+) -> Mapping[str, Any]:
+    """Return *nlu_intents* if NluIntentsMiddleware supplied it, else read ``message.nlu``."""
+    if nlu_intents is not None:
+        return nlu_intents
+    return message.nlu.intents if message.nlu is not None else {}
+
+
+class NluIntentsMiddleware(BaseMiddleware[Message]):
+    """Expose ``message.nlu.intents`` to filters and handlers as ``nlu_intents``.
+
+    Read once per update, so intent filters do not each walk ``message.nlu``.
+    """
+
+    async def __call__(
+        self,
+        handler: Callable[[Message, dict[str, Any]], Awaitable[Any]],
+        event: Message,
+        data: dict[str, Any],
+    ) -> Any:
+        data["nlu_intents"] = get_nlu_intents(event)
+        return await handler(event, data)
@@ -9,7 +9,11 @@ from alice_ticktick.dialogs.nlp.date_parser import (
 from alice_ticktick.dialogs.nlp.duration_parser import parse_duration
 from alice_ticktick.dialogs.nlp.fuzzy_search import find_best_match, find_matches
 from alice_ticktick.dialogs.nlp.priority_parser import parse_priority
-from alice_ticktick.dialogs.nlp.recurrence_parser import build_rrule, format_recurrence
+from alice_ticktick.dialogs.nlp.recurrence_parser import (
+    build_rrule,
+    format_recurrence,
+    match_freq_keyword,
+)
 from alice_ticktick.dialogs.nlp.reminder_parser import build_trigger, format_reminder
 
 __all__ = [
@@ -21,6 +25,7 @@ __all__ = [
     "find_matches",
     "format_recurrence",
     "format_reminder",
+    "match_freq_keyword",
     "parse_date_range",
     "parse_duration",
     "parse_priority",
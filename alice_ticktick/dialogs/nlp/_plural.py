@@ -0,0 +1,24 @@
+"""Russian noun pluralization by the 1 / 2-4 / 5+ rule."""
+
+from __future__ import annotations
+
+
+def _form_index(n: int) -> int:
+    """Return the plural form index (0, 1 or 2) for a non-negative *n*."""
+    if n % 10 == 1 and n % 100 != 11:
+        return 0
+    if n % 10 in (2, 3, 4) and n % 100 not in (12, 13, 14):
+        return 1
+    return 2
+
+
+# The form is fully determined by n % 100, so precompute it once.
+_FORM_IDX: tuple[int, ...] = tuple(_form_index(i) for i in range(100))
+
+
+def pluralize(n: int, forms: tuple[str, str, str]) -> str:
+    """Russian pluralization: 1 день, 2 дня, 5 дней.
+
+    *forms* are the (1, 2-4, 5+) forms of the noun.
+    """
+    return f"{n} {forms[_FORM_IDX[abs(n) % 100]]}"
@@ -5,6 +5,8 @@ from __future__ import annotations
 import calendar
 import contextlib
 import datetime
+import itertools
+import operator
 from dataclasses import dataclass
 from typing import TYPE_CHECKING, TypedDict
 from zoneinfo import ZoneInfo
@@ -115,6 +117,12 @@ def _add_years(dt: datetime.datetime, years: int) -> datetime.datetime:
     return dt.replace(year=year, day=day)
 
 
+# Prepositions and date words stripped from the edges of a task name
+_EDGE_STRIP_TOKENS = frozenset(
+    {"на", "с", "в", "до", "по", "к", "завтра", "сегодня", "послезавтра", "вчера"}
+)
+
+
 @dataclass
 class ExtractedDates:
     """Dates extracted from NLU entities with cleaned task name."""
@@ -143,64 +151,60 @@ def extract_dates_from_nlu(
 
     tokens = nlu.tokens
 
-    # Collect DATETIME entities that are AFTER the command tokens
-    dt_entities = []
+    # Collect DATETIME entities that are AFTER the command tokens, reading each
+    # entity's attributes once into a (start, end, value) span
+    dt_spans: list[tuple[int, int, DateTimeEntity]] = []
     for entity in nlu.entities:
         if entity.type != "YANDEX.DATETIME":
             continue
-        if entity.tokens.start < command_token_count:
+        span = entity.tokens
+        if span.start < command_token_count:
             continue
-        if not isinstance(entity.value, DateTimeEntity):
+        value = entity.value
+        if not isinstance(value, DateTimeEntity):
             continue
-        dt_entities.append(entity)
+        dt_spans.append((span.start, span.end, value))
 
     # Sort by token position
-    dt_entities.sort(key=lambda e: e.tokens.start)
+    dt_spans.sort(key=operator.itemgetter(0))
 
-    # Build set of token indices occupied by DATETIME entities
-    dt_token_indices: set[int] = set()
-    for entity in dt_entities:
-        dt_token_indices.update(range(entity.tokens.start, entity.tokens.end))
+    # Keep-mask over tokens: clear the ranges occupied by DATETIME entities
+    n_tokens = len(tokens)
+    keep = bytearray(b"\x01") * n_tokens
+    for start, end, _value in dt_spans:
+        end = min(end, n_tokens)
+        if end > start:
+            keep[start:end] = bytes(end - start)
 
     # Task name = tokens after command, excluding DATETIME token ranges
-    name_tokens = [
-        tokens[i] for i in range(command_token_count, len(tokens)) if i not in dt_token_indices
-    ]
+    name_tokens = list(
+        itertools.compress(tokens[command_token_count:], keep[command_token_count:])
+    )
     # Strip prepositions and date words left at the edges.
     # Yandex NLU may not include "завтра" in DATETIME entity token range
     # even though its semantics are captured in the entity value.
-    _strip = {
-        "на",
-        "с",
-        "в",
-        "до",
-        "по",
-        "к",  # prepositions
-        "завтра",
-        "сегодня",
-        "послезавтра",
-        "вчера",  # date words
-    }
-    while name_tokens and name_tokens[-1] in _strip:
-        name_tokens.pop()
-    while name_tokens and name_tokens[0] in _strip:
-        name_tokens.pop(0)
+    first, last = 0, len(name_tokens)
+    while last > first and name_tokens[last - 1] in _EDGE_STRIP_TOKENS:
+        last -= 1
+    while first < last and name_tokens[first] in _EDGE_STRIP_TOKENS:
+        first += 1
+    name_tokens = name_tokens[first:last]
 
     task_name = " ".join(name_tokens)
 
-    # Parse dates
+    # Parse dates against a single "now" shared by both entities
     start_date = None
     end_date = None
+    if dt_spans and now is None:
+        now = datetime.datetime.now(tz=datetime.UTC)
 
-    if len(dt_entities) >= 1:
-        val = dt_entities[0].value
-        slot = _datetime_entity_to_slot(val)
+    if len(dt_spans) >= 1:
+        slot = _datetime_entity_to_slot(dt_spans[0][2])
         with contextlib.suppress(ValueError):
             start_date = parse_yandex_datetime(slot, now=now)
 
-    if len(dt_entities) >= 2:
-        val = dt_entities[-1].value
-        slot = _datetime_entity_to_slot(val)
+    if len(dt_spans) >= 2:
+        slot = _datetime_entity_to_slot(dt_spans[-1][2])
         with contextlib.suppress(ValueError):
             # Parse end date relative to start date's base
             if start_date and isinstance(start_date, datetime.datetime):
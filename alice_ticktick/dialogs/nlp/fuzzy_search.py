@@ -2,10 +2,23 @@
 
 from __future__ import annotations
 
+import functools
+
 from rapidfuzz import fuzz, process
 from rapidfuzz import utils as rf_utils
 
 
+@functools.lru_cache(maxsize=2048)
+def _sort_key(text: str) -> str:
+    """Normalize *text* and sort its tokens, as ``token_sort_ratio`` does internally.
+
+    Task titles repeat across requests in a warm container, so each title is
+    processed once; scoring the keys with plain ``ratio`` gives the same scores as
+    ``token_sort_ratio`` with ``default_process``.
+    """
+    return " ".join(sorted(rf_utils.default_process(text).split()))
+
+
 def find_best_match(
     query: str,
     candidates: list[str],
@@ -24,16 +37,15 @@ def find_best_match(
         return None
 
     result = process.extractOne(
-        query,
-        candidates,
-        scorer=fuzz.token_sort_ratio,
-        processor=rf_utils.default_process,
+        _sort_key(query),
+        [_sort_key(candidate) for candidate in candidates],
+        scorer=fuzz.ratio,
         score_cutoff=threshold,
     )
     if result is None:
         return None
-    match, _score, index = result
-    return str(match), int(index)
+    _key, _score, index = result
+    return candidates[index], int(index)
 
 
 def find_matches(
@@ -51,11 +63,10 @@ def find_matches(
         return []
 
     results = process.extract(
-        query,
-        candidates,
-        scorer=fuzz.token_sort_ratio,
-        processor=rf_utils.default_process,
+        _sort_key(query),
+        [_sort_key(candidate) for candidate in candidates],
+        scorer=fuzz.ratio,
         score_cutoff=threshold,
         limit=limit,
     )
-    return [(str(match), float(score), int(idx)) for match, score, idx in results]
+    return [(candidates[idx], float(score), int(idx)) for _key, score, idx in results]
@@ -2,59 +2,72 @@
 
 from __future__ import annotations
 
+import dataclasses
+import functools
 import logging
+from types import MappingProxyType
+from typing import TYPE_CHECKING
+
+from alice_ticktick.dialogs.nlp._plural import pluralize
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable, Mapping
 
 logger = logging.getLogger(__name__)
 
 # Mapping: normalized rec_freq value → (FREQ, optional BYDAY)
-_FREQ_MAP: dict[str, tuple[str, str | None]] = {
-    # Basic frequencies
-    "день": ("DAILY", None),
-    "дня": ("DAILY", None),
-    "дней": ("DAILY", None),
-    "ежедневно": ("DAILY", None),
-    "неделю": ("WEEKLY", None),
-    "неделя": ("WEEKLY", None),
-    "недели": ("WEEKLY", None),
-    "недель": ("WEEKLY", None),
-    "еженедельно": ("WEEKLY", None),
-    "месяц": ("MONTHLY", None),
-    "месяца": ("MONTHLY", None),
-    "месяцев": ("MONTHLY", None),
-    "ежемесячно": ("MONTHLY", None),
-    "год": ("YEARLY", None),
-    "года": ("YEARLY", None),
-    "лет": ("YEARLY", None),
-    "ежегодно": ("YEARLY", None),
-    # Days of week
-    "понедельник": ("WEEKLY", "MO"),
-    "вторник": ("WEEKLY", "TU"),
-    "среду": ("WEEKLY", "WE"),
-    "среда": ("WEEKLY", "WE"),
-    "четверг": ("WEEKLY", "TH"),
-    "пятницу": ("WEEKLY", "FR"),
-    "пятница": ("WEEKLY", "FR"),
-    "субботу": ("WEEKLY", "SA"),
-    "суббота": ("WEEKLY", "SA"),
-    "воскресенье": ("WEEKLY", "SU"),
-    # Groups
-    "будни": ("WEEKLY", "MO,TU,WE,TH,FR"),
-    "будний": ("WEEKLY", "MO,TU,WE,TH,FR"),
-    "будням": ("WEEKLY", "MO,TU,WE,TH,FR"),
-    "выходные": ("WEEKLY", "SA,SU"),
-    "выходным": ("WEEKLY", "SA,SU"),
-}
+_FREQ_MAP: Mapping[str, tuple[str, str | None]] = MappingProxyType(
+    {
+        # Basic frequencies
+        "день": ("DAILY", None),
+        "дня": ("DAILY", None),
+        "дней": ("DAILY", None),
+        "ежедневно": ("DAILY", None),
+        "неделю": ("WEEKLY", None),
+        "неделя": ("WEEKLY", None),
+        "недели": ("WEEKLY", None),
+        "недель": ("WEEKLY", None),
+        "еженедельно": ("WEEKLY", None),
+        "месяц": ("MONTHLY", None),
+        "месяца": ("MONTHLY", None),
+        "месяцев": ("MONTHLY", None),
+        "ежемесячно": ("MONTHLY", None),
+        "год": ("YEARLY", None),
+        "года": ("YEARLY", None),
+        "лет": ("YEARLY", None),
+        "ежегодно": ("YEARLY", None),
+        # Days of week
+        "понедельник": ("WEEKLY", "MO"),
+        "вторник": ("WEEKLY", "TU"),
+        "среду": ("WEEKLY", "WE"),
+        "среда": ("WEEKLY", "WE"),
+        "четверг": ("WEEKLY", "TH"),
+        "пятницу": ("WEEKLY", "FR"),
+        "пятница": ("WEEKLY", "FR"),
+        "субботу": ("WEEKLY", "SA"),
+        "суббота": ("WEEKLY", "SA"),
+        "воскресенье": ("WEEKLY", "SU"),
+        # Groups
+        "будни": ("WEEKLY", "MO,TU,WE,TH,FR"),
+        "будний": ("WEEKLY", "MO,TU,WE,TH,FR"),
+        "будням": ("WEEKLY", "MO,TU,WE,TH,FR"),
+        "выходные": ("WEEKLY", "SA,SU"),
+        "выходным": ("WEEKLY", "SA,SU"),
+    }
+)
 
 # Reverse mapping for format_recurrence
-_BYDAY_TO_RU: dict[str, str] = {
-    "MO": "понедельник",
-    "TU": "вторник",
-    "WE": "среду",
-    "TH": "четверг",
-    "FR": "пятницу",
-    "SA": "субботу",
-    "SU": "воскресенье",
-}
+_BYDAY_TO_RU: Mapping[str, str] = MappingProxyType(
+    {
+        "MO": "понедельник",
+        "TU": "вторник",
+        "WE": "среду",
+        "TH": "четверг",
+        "FR": "пятницу",
+        "SA": "субботу",
+        "SU": "воскресенье",
+    }
+)
 
 _FREQ_TO_RU: dict[str, tuple[str, tuple[str, str, str]]] = {
     # (singular "каждый X", (1-form, 2-4-form, 5+-form) for interval)
@@ -67,79 +80,128 @@ _FREQ_TO_RU: dict[str, tuple[str, tuple[str, str, str]]] = {
 
 def _pluralize_interval(n: int, forms: tuple[str, str, str]) -> str:
     """Russian pluralization: 1 день, 2 дня, 5 дней."""
-    abs_n = abs(n)
-    if abs_n % 10 == 1 and abs_n % 100 != 11:
-        return f"{n} {forms[0]}"
-    if abs_n % 10 in (2, 3, 4) and abs_n % 100 not in (12, 13, 14):
-        return f"{n} {forms[1]}"
-    return f"{n} {forms[2]}"
+    return pluralize(n, forms)
 
 
-def build_rrule(
-    *,
-    rec_freq: str | None = None,
-    rec_interval: int | None = None,
-    rec_monthday: int | None = None,
-) -> str | None:
-    """Convert NLU recurrence slots to an RRULE string.
+def _format_rrule(freq: str, byday: str | None, interval: int | None = None) -> str:
+    """Assemble an RRULE string from FREQ, optional INTERVAL and optional BYDAY."""
+    rrule = f"RRULE:FREQ={freq}"
+    if interval is not None and interval > 1:
+        rrule += f";INTERVAL={interval}"
+    if byday is not None:
+        rrule += f";BYDAY={byday}"
+    return rrule
 
-    Returns None if no valid recurrence could be built.
-    """
-    # Monthday takes priority: "каждое 15 число"
-    if rec_monthday is not None:
-        return f"RRULE:FREQ=MONTHLY;BYMONTHDAY={rec_monthday}"
 
-    if rec_freq is None:
+# Precomputed RRULE strings for the common no-interval case, keyed by the raw NLU value
+# (as-is and capitalized), so most calls skip normalization and string assembly.
+_RRULE_NO_INTERVAL: dict[str, str] = {
+    variant: _format_rrule(freq, byday)
+    for key, (freq, byday) in _FREQ_MAP.items()
+    for variant in (key, key.capitalize())
+}
+
+
+@dataclasses.dataclass(slots=True)
+class _TrieNode:
+    """Node of the recurrence keyword trie; *keyword* is set on terminal nodes."""
+
+    children: dict[str, _TrieNode] = dataclasses.field(default_factory=dict)
+    keyword: str | None = None
+
+
+def _build_trie(keywords: Iterable[str]) -> _TrieNode:
+    """Build a character trie over *keywords*."""
+    root = _TrieNode()
+    for keyword in keywords:
+        node = root
+        for char in keyword:
+            node = node.children.setdefault(char, _TrieNode())
+        node.keyword = keyword
+    return root
+
+
+_FREQ_TRIE = _build_trie(_FREQ_MAP)
+
+
+def match_freq_keyword(text: str) -> tuple[str, str, str | None] | None:
+    """Match the first word of *text* against the recurrence keywords.
+
+    *text* is expected lowercased and stripped. The trie is walked once over the
+    first word, without splitting the string.
+
+    Returns ``(keyword, FREQ, BYDAY)`` or None if the first word is not a keyword.
+    """
+    node = _FREQ_TRIE
+    for char in text:
+        if char.isspace():
+            break
+        child = node.children.get(char)
+        if child is None:
+            return None
+        node = child
+    if node.keyword is None:
         return None
+    freq, byday = _FREQ_MAP[node.keyword]
+    return node.keyword, freq, byday
+
 
+def _lookup_freq(rec_freq: str) -> tuple[str, str | None] | None:
+    """Normalize a raw rec_freq value and look it up in _FREQ_MAP."""
     normalized = rec_freq.lower().strip()
     entry = _FREQ_MAP.get(normalized)
     if entry is None:
         # Defense-in-depth: _infer_rec_freq_from_tokens normally cleans greedy NLU values,
         # but build_rrule can also be called directly. Try the first word as a fallback.
-        first_word = normalized.split()[0] if normalized else ""
-        entry = _FREQ_MAP.get(first_word)
-        if entry is not None:
+        match = match_freq_keyword(normalized)
+        if match is not None:
+            first_word, freq, byday = match
             logger.warning(
                 "build_rrule first-word fallback: full=%r, using first_word=%r",
                 rec_freq,
                 first_word,
             )
-    if entry is None:
-        return None
+            entry = (freq, byday)
+    return entry
 
-    freq, byday = entry
 
-    parts = [f"FREQ={freq}"]
-    if rec_interval is not None and rec_interval > 1:
-        parts.append(f"INTERVAL={rec_interval}")
-    if byday is not None:
-        parts.append(f"BYDAY={byday}")
+def build_rrule(
+    *,
+    rec_freq: str | None = None,
+    rec_interval: int | None = None,
+    rec_monthday: int | None = None,
+) -> str | None:
+    """Convert NLU recurrence slots to an RRULE string.
 
-    return "RRULE:" + ";".join(parts)
+    Returns None if no valid recurrence could be built.
+    """
+    # Monthday takes priority: "каждое 15 число"
+    if rec_monthday is not None:
+        return f"RRULE:FREQ=MONTHLY;BYMONTHDAY={rec_monthday}"
 
+    if rec_freq is None:
+        return None
 
-def format_recurrence(rrule: str | None) -> str | None:
-    """Convert an RRULE string to a human-readable Russian description.
+    if rec_interval is None or rec_interval <= 1:
+        rrule = _RRULE_NO_INTERVAL.get(rec_freq)
+        if rrule is not None:
+            return rrule
 
-    Returns None if rrule is None.
-    """
-    if rrule is None:
+    entry = _lookup_freq(rec_freq)
+    if entry is None:
         return None
 
-    # Parse RRULE components
-    body = rrule.removeprefix("RRULE:")
-    params: dict[str, str] = {}
-    for part in body.split(";"):
-        if "=" in part:
-            key, val = part.split("=", 1)
-            params[key] = val
+    freq, byday = entry
+    return _format_rrule(freq, byday, rec_interval)
 
-    freq = params.get("FREQ")
-    interval = params.get("INTERVAL")
-    byday = params.get("BYDAY")
-    bymonthday = params.get("BYMONTHDAY")
 
+def _describe_recurrence(
+    freq: str | None,
+    interval: str | None,
+    byday: str | None,
+    bymonthday: str | None,
+) -> str:
+    """Describe parsed RRULE components in Russian."""
     if bymonthday is not None:
         return f"каждое {bymonthday} число"
 
@@ -159,3 +221,40 @@ def format_recurrence(rrule: str | None) -> str | None:
         return singular
 
     return "повторяется"
+
+
+def format_recurrence(rrule: str | None) -> str | None:
+    """Convert an RRULE string to a human-readable Russian description.
+
+    Returns None if rrule is None.
+    """
+    if rrule is None:
+        return None
+    return _format_recurrence_impl(rrule)
+
+
+@functools.lru_cache(maxsize=512)
+def _format_recurrence_impl(rrule: str) -> str:
+    # Parse RRULE components in a single pass over the string
+    body = rrule.removeprefix("RRULE:")
+    freq: str | None = None
+    interval: str | None = None
+    byday: str | None = None
+    bymonthday: str | None = None
+    start = 0
+    length = len(body)
+    while start < length:
+        end = body.find(";", start)
+        if end == -1:
+            end = length
+        if body.startswith("FREQ=", start, end):
+            freq = body[start + 5 : end]
+        elif body.startswith("INTERVAL=", start, end):
+            interval = body[start + 9 : end]
+        elif body.startswith("BYDAY=", start, end):
+            byday = body[start + 6 : end]
+        elif body.startswith("BYMONTHDAY=", start, end):
+            bymonthday = body[start + 11 : end]
+        start = end + 1
+
+    return _describe_recurrence(freq, interval, byday, bymonthday)
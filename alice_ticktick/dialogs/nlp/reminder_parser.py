@@ -2,30 +2,42 @@
 
 from __future__ import annotations
 
-import re
-
-_UNIT_MAP: dict[str, str] = {
-    # minutes
-    "минуту": "M",
-    "минута": "M",
-    "минуты": "M",
-    "минут": "M",
-    # hours
-    "час": "H",
-    "часа": "H",
-    "часов": "H",
-    # days
-    "день": "D",
-    "дня": "D",
-    "дней": "D",
-}
+import functools
+from types import MappingProxyType
+from typing import TYPE_CHECKING
+
+from alice_ticktick.dialogs.nlp._plural import pluralize
+
+if TYPE_CHECKING:
+    from collections.abc import Mapping
+
+_UNIT_MAP: Mapping[str, str] = MappingProxyType(
+    {
+        # minutes
+        "минуту": "M",
+        "минута": "M",
+        "минуты": "M",
+        "минут": "M",
+        # hours
+        "час": "H",
+        "часа": "H",
+        "часов": "H",
+        # days
+        "день": "D",
+        "дня": "D",
+        "дней": "D",
+    }
+)
 
 # For pluralization in format_reminder
 _MINUTE_FORMS = ("минуту", "минуты", "минут")  # 1, 2-4, 5+
 _HOUR_FORMS = ("час", "часа", "часов")
 _DAY_FORMS = ("день", "дня", "дней")
 
-_TRIGGER_RE = re.compile(r"TRIGGER:(-?)P(?:T(?:(\d+)H)?(?:(\d+)M)?(?:(\d+)S)?|(\d+)D)")
+# TRIGGER prefix per unit code: time units go after "T", days do not.
+_TRIGGER_PREFIX: Mapping[str, str] = MappingProxyType(
+    {"M": "TRIGGER:-PT", "H": "TRIGGER:-PT", "D": "TRIGGER:-P"}
+)
 
 
 def build_trigger(value: int | None, unit: str | None) -> str | None:
@@ -34,6 +46,11 @@ def build_trigger(value: int | None, unit: str | None) -> str | None:
     When value is None but unit is provided, defaults to 1 (e.g. "за час" → 1 hour).
     Returns None if unit is missing/unknown.
     """
+    return _build_trigger_impl(value, unit)
+
+
+@functools.lru_cache(maxsize=512)
+def _build_trigger_impl(value: int | None, unit: str | None) -> str | None:
     if unit is None:
         return None
 
@@ -47,19 +64,12 @@ def build_trigger(value: int | None, unit: str | None) -> str | None:
     if code is None:
         return None
 
-    if code == "D":
-        return f"TRIGGER:-P{value}D"
-    return f"TRIGGER:-PT{value}{code}"
+    return f"{_TRIGGER_PREFIX[code]}{value}{code}"
 
 
 def _pluralize(n: int, forms: tuple[str, str, str]) -> str:
     """Russian pluralization: 1 минуту, 2 минуты, 5 минут."""
-    abs_n = abs(n)
-    if abs_n % 10 == 1 and abs_n % 100 != 11:
-        return f"{n} {forms[0]}"
-    if abs_n % 10 in (2, 3, 4) and abs_n % 100 not in (12, 13, 14):
-        return f"{n} {forms[1]}"
-    return f"{n} {forms[2]}"
+    return pluralize(n, forms)
 
 
 def format_reminder(trigger: str | None) -> str | None:
@@ -69,21 +79,59 @@ def format_reminder(trigger: str | None) -> str | None:
     """
     if trigger is None:
         return None
+    return _format_reminder_impl(trigger)
+
 
+@functools.lru_cache(maxsize=512)
+def _format_reminder_impl(trigger: str) -> str:
     if trigger == "TRIGGER:PT0S":
         return "в момент задачи"
 
-    m = _TRIGGER_RE.match(trigger)
-    if not m:
-        return "напоминание"
+    days, hours, minutes = _scan_trigger(trigger)
 
-    _sign, hours, minutes, _seconds, days = m.groups()
-
-    if days:
-        return f"за {_pluralize(int(days), _DAY_FORMS)}"
-    if hours:
-        return f"за {_pluralize(int(hours), _HOUR_FORMS)}"
-    if minutes:
-        return f"за {_pluralize(int(minutes), _MINUTE_FORMS)}"
+    if days is not None:
+        return f"за {_pluralize(days, _DAY_FORMS)}"
+    if hours is not None:
+        return f"за {_pluralize(hours, _HOUR_FORMS)}"
+    if minutes is not None:
+        return f"за {_pluralize(minutes, _MINUTE_FORMS)}"
 
     return "напоминание"
+
+
+def _scan_number(text: str, start: int) -> int:
+    """Return the index just past the run of digits starting at *start*."""
+    end = start
+    while end < len(text) and text[end].isdecimal():
+        end += 1
+    return end
+
+
+def _scan_trigger(trigger: str) -> tuple[int | None, int | None, int | None]:
+    """Parse ``TRIGGER:[-]P(T[nH][nM][nS] | nD)`` into (days, hours, minutes).
+
+    Components that are absent, or a malformed trigger, yield None.
+    """
+    if not trigger.startswith("TRIGGER:"):
+        return None, None, None
+    pos = 8
+    if trigger.startswith("-", pos):
+        pos += 1
+    if not trigger.startswith("P", pos):
+        return None, None, None
+    pos += 1
+
+    if not trigger.startswith("T", pos):
+        end = _scan_number(trigger, pos)
+        if end > pos and trigger.startswith("D", end):
+            return int(trigger[pos:end]), None, None
+        return None, None, None
+
+    pos += 1
+    parsed: dict[str, int] = {}
+    for unit in "HMS":
+        end = _scan_number(trigger, pos)
+        if end > pos and trigger.startswith(unit, end):
+            parsed[unit] = int(trigger[pos:end])
+            pos = end + 1
+    return None, parsed.get("H"), parsed.get("M")
@@ -3,9 +3,12 @@
 NOTE: a subset of these constants is duplicated in tests/e2e/expected_responses.py
 to avoid importing aliceio in the e2e environment. If you change strings used
 there (WELCOME, UNKNOWN, DELETE_CANCELLED, TASK_NAME_REQUIRED,
-DURATION_MISSING_START_TIME, GOODBYE), update that file as well.
+DURATION_MISSING_START_TIME, GOODBYE), update that file as well —
+tests/test_responses.py fails if the two copies drift apart.
 """
 
+from alice_ticktick.dialogs.nlp._plural import pluralize
+
 # Welcome / help
 WELCOME = "Слушаю!"
 WELCOME_TTS = "Слушаю!"
@@ -250,10 +253,9 @@ def format_priority_instrumental(priority: str) -> str:
     return _PRIORITY_INSTRUMENTAL.get(priority, priority)
 
 
+_TASK_FORMS = ("задача", "задачи", "задач")
+
+
 def pluralize_tasks(count: int) -> str:
     """Pluralize 'задача' in Russian: 1 задача, 2 задачи, 5 задач."""
-    if count % 10 == 1 and count % 100 != 11:
-        return f"{count} задача"
-    if count % 10 in (2, 3, 4) and count % 100 not in (12, 13, 14):
-        return f"{count} задачи"
-    return f"{count} задач"
+    return pluralize(count, _TASK_FORMS)
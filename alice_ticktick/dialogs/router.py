@@ -2,6 +2,8 @@
 
 from __future__ import annotations
 
+import dataclasses
+import inspect
 import logging
 import re
 from typing import TYPE_CHECKING, Any
@@ -10,7 +12,7 @@ from aliceio import Router
 from aliceio.types import Response, Update
 
 from alice_ticktick.dialogs import responses as txt
-from alice_ticktick.dialogs.filters import IntentFilter, NewSessionFilter
+from alice_ticktick.dialogs.filters import IntentDispatchFilter, IntentFilter, NewSessionFilter
 from alice_ticktick.dialogs.handlers import (
     handle_add_checklist_item,
     handle_add_reminder,
@@ -67,9 +69,12 @@ from alice_ticktick.dialogs.intents import (
     SEARCH_TASK,
     SHOW_CHECKLIST,
 )
+from alice_ticktick.dialogs.middlewares import NluIntentsMiddleware, get_nlu_intents
 from alice_ticktick.dialogs.states import CompleteTaskStates, DeleteTaskStates, EditTaskStates
 
 if TYPE_CHECKING:
+    from collections.abc import Awaitable, Callable, Mapping
+
     from aliceio.fsm.context import FSMContext
     from aliceio.types import Message
 
@@ -229,6 +234,21 @@ def _try_parse_checklist_command(command: str) -> tuple[str, str] | None:
 
 
 router = Router(name="main")
+router.message.outer_middleware(NluIntentsMiddleware())
+
+
+def _confirm_answer(message: Message, nlu_intents: Mapping[str, Any] | None) -> str | None:
+    """Return YANDEX.CONFIRM or YANDEX.REJECT if NLU recognized one, else None.
+
+    Confirmation states read the intents once here instead of running a separate
+    intent filter per outcome.
+    """
+    nlu_intents = get_nlu_intents(message, nlu_intents)
+    if "YANDEX.CONFIRM" in nlu_intents:
+        return "YANDEX.CONFIRM"
+    if "YANDEX.REJECT" in nlu_intents:
+        return "YANDEX.REJECT"
+    return None
 
 
 @router.message(NewSessionFilter())
@@ -237,30 +257,24 @@ async def on_new_session(message: Message) -> Response:
     return await handle_welcome(message)
 
 
-@router.message(IntentFilter("YANDEX.HELP"))
-@router.message(IntentFilter("YANDEX.WHAT_CAN_YOU_DO"))
 async def on_help(message: Message) -> Response:
     """Handle help and 'what can you do' requests."""
     return await handle_help(message)
 
 
-@router.message(IntentFilter(MORNING_BRIEFING))
 async def on_morning_briefing(message: Message, event_update: Update) -> Response:
     """Handle morning_briefing intent."""
     return await handle_morning_briefing(message, event_update=event_update)
 
 
-@router.message(IntentFilter(EVENING_BRIEFING))
 async def on_evening_briefing(message: Message, event_update: Update) -> Response:
     """Handle evening_briefing intent."""
     return await handle_evening_briefing(message, event_update=event_update)
 
 
-# --- Specific "добавь..." intents BEFORE generic create_task ---
 _SUBTASK_KEYWORDS = frozenset({"подзадачу", "подзадача", "подзадачи"})
 
 
-@router.message(IntentFilter(ADD_SUBTASK))
 async def on_add_subtask(
     message: Message, intent_data: dict[str, Any], event_update: Update
 ) -> Response:
@@ -270,15 +284,16 @@ async def on_add_subtask(
     intents because "в" looks like a subtask separator.  Prefer create_task
     unless the utterance explicitly contains a subtask keyword.
     """
-    if message.nlu and message.nlu.intents and CREATE_TASK in message.nlu.intents:
-        tokens = set(message.nlu.tokens or [])
-        if not tokens & _SUBTASK_KEYWORDS:
-            create_data = message.nlu.intents[CREATE_TASK]
+    nlu = message.nlu
+    if nlu is not None and nlu.intents:
+        create_data = nlu.intents.get(CREATE_TASK)
+        if create_data is not None and not any(
+            token in _SUBTASK_KEYWORDS for token in nlu.tokens or ()
+        ):
             return await handle_create_task(message, create_data, event_update=event_update)
     return await handle_add_subtask(message, intent_data, event_update=event_update)
 
 
-@router.message(IntentFilter(ADD_CHECKLIST_ITEM))
 async def on_add_checklist_item(
     message: Message, intent_data: dict[str, Any], event_update: Update
 ) -> Response:
@@ -286,7 +301,6 @@ async def on_add_checklist_item(
     return await handle_add_checklist_item(message, intent_data, event_update=event_update)
 
 
-@router.message(IntentFilter(CREATE_RECURRING_TASK))
 async def on_create_recurring_task(
     message: Message, intent_data: dict[str, Any], event_update: Update
 ) -> Response:
@@ -294,7 +308,6 @@ async def on_create_recurring_task(
     return await handle_create_recurring_task(message, intent_data, event_update=event_update)
 
 
-@router.message(IntentFilter(ADD_REMINDER))
 async def on_add_reminder(
     message: Message, intent_data: dict[str, Any], event_update: Update
 ) -> Response:
@@ -302,7 +315,6 @@ async def on_add_reminder(
     return await handle_add_reminder(message, intent_data, event_update=event_update)
 
 
-@router.message(IntentFilter(CREATE_TASK))
 async def on_create_task(
     message: Message, intent_data: dict[str, Any], event_update: Update
 ) -> Response:
@@ -333,14 +345,11 @@ async def on_create_task(
     return await handle_create_task(message, intent_data, event_update=event_update)
 
 
-# --- Project intents BEFORE generic list_tasks ---
-@router.message(IntentFilter(LIST_PROJECTS))
 async def on_list_projects(message: Message, event_update: Update) -> Response:
     """Handle list_projects intent."""
     return await handle_list_projects(message, event_update=event_update)
 
 
-@router.message(IntentFilter(PROJECT_TASKS))
 async def on_project_tasks(
     message: Message, intent_data: dict[str, Any], event_update: Update
 ) -> Response:
@@ -348,7 +357,6 @@ async def on_project_tasks(
     return await handle_project_tasks(message, intent_data, event_update=event_update)
 
 
-@router.message(IntentFilter(CREATE_PROJECT))
 async def on_create_project(
     message: Message, intent_data: dict[str, Any], event_update: Update
 ) -> Response:
@@ -356,8 +364,6 @@ async def on_create_project(
     return await handle_create_project(message, intent_data, event_update=event_update)
 
 
-# --- Specific "покажи..." intents BEFORE generic list_tasks ---
-@router.message(IntentFilter(LIST_SUBTASKS))
 async def on_list_subtasks(
     message: Message, intent_data: dict[str, Any], event_update: Update
 ) -> Response:
@@ -365,7 +371,6 @@ async def on_list_subtasks(
     return await handle_list_subtasks(message, intent_data, event_update=event_update)
 
 
-@router.message(IntentFilter(OVERDUE_TASKS))
 async def on_overdue_tasks(
     message: Message,
     intent_data: dict[str, Any],
@@ -375,7 +380,6 @@ async def on_overdue_tasks(
     return await handle_overdue_tasks(message, intent_data, event_update=event_update)
 
 
-@router.message(IntentFilter(LIST_TASKS))
 async def on_list_tasks(
     message: Message,
     intent_data: dict[str, Any],
@@ -396,8 +400,6 @@ async def on_list_tasks(
     return await handle_list_tasks(message, intent_data, event_update=event_update)
 
 
-# --- Specific "отметь..." intent BEFORE generic complete_task ---
-@router.message(IntentFilter(CHECK_ITEM))
 async def on_check_item(
     message: Message, intent_data: dict[str, Any], event_update: Update
 ) -> Response:
@@ -405,7 +407,6 @@ async def on_check_item(
     return await handle_check_item(message, intent_data, event_update=event_update)
 
 
-@router.message(IntentFilter(COMPLETE_TASK))
 async def on_complete_task(
     message: Message, intent_data: dict[str, Any], state: FSMContext, event_update: Update
 ) -> Response:
@@ -431,7 +432,6 @@ async def on_complete_task(
     return await handle_complete_task(message, intent_data, state, event_update=event_update)
 
 
-@router.message(IntentFilter(SEARCH_TASK))
 async def on_search_task(
     message: Message, intent_data: dict[str, Any], event_update: Update
 ) -> Response:
@@ -439,8 +439,6 @@ async def on_search_task(
     return await handle_search_task(message, intent_data, event_update=event_update)
 
 
-# --- show_checklist BEFORE edit_task for safety ---
-@router.message(IntentFilter(SHOW_CHECKLIST))
 async def on_show_checklist(
     message: Message, intent_data: dict[str, Any], event_update: Update
 ) -> Response:
@@ -448,7 +446,6 @@ async def on_show_checklist(
     return await handle_show_checklist(message, intent_data, event_update=event_update)
 
 
-@router.message(IntentFilter(EDIT_TASK))
 async def on_edit_task(
     message: Message, intent_data: dict[str, Any], state: FSMContext, event_update: Update
 ) -> Response:
@@ -456,8 +453,6 @@ async def on_edit_task(
     return await handle_edit_task(message, intent_data, state, event_update=event_update)
 
 
-# --- Specific "удали..." intent BEFORE generic delete_task ---
-@router.message(IntentFilter(DELETE_CHECKLIST_ITEM))
 async def on_delete_checklist_item(
     message: Message, intent_data: dict[str, Any], event_update: Update
 ) -> Response:
@@ -465,7 +460,6 @@ async def on_delete_checklist_item(
     return await handle_delete_checklist_item(message, intent_data, event_update=event_update)
 
 
-@router.message(IntentFilter(DELETE_TASK))
 async def on_delete_task(
     message: Message, intent_data: dict[str, Any], state: FSMContext, event_update: Update
 ) -> Response:
@@ -493,22 +487,93 @@ async def on_delete_task(
     return await handle_delete_task(message, intent_data, state, event_update=event_update)
 
 
-# FSM handlers for complete confirmation — must be BEFORE the unknown handler
-@router.message(CompleteTaskStates.confirm, IntentFilter("YANDEX.CONFIRM"))
-async def on_complete_confirm(
-    message: Message, state: FSMContext, event_update: Update
+# Optional arguments an intent handler may ask for, besides the message
+_INTENT_HANDLER_KWARGS = ("intent_data", "state", "event_update")
+
+
+@dataclasses.dataclass(frozen=True, slots=True)
+class _IntentRoute:
+    """Intent handler with the keyword arguments it accepts, resolved once at import."""
+
+    callback: Callable[..., Awaitable[Response]]
+    kwargs: tuple[str, ...]
+
+    @classmethod
+    def for_callback(cls, callback: Callable[..., Awaitable[Response]]) -> _IntentRoute:
+        params = inspect.signature(callback).parameters
+        return cls(callback, tuple(name for name in _INTENT_HANDLER_KWARGS if name in params))
+
+
+# Intent handlers in dispatch priority order: when NLU fires several intents at once,
+# the one listed first wins. Specific intents go BEFORE the generic ones they overlap
+# with: "добавь..." before create_task, project and "покажи..." intents before
+# list_tasks, "отметь..." before complete_task, show_checklist before edit_task,
+# "удали..." before delete_task.
+_INTENT_HANDLERS: dict[str, _IntentRoute] = {
+    intent_id: _IntentRoute.for_callback(callback)
+    for intent_id, callback in (
+        ("YANDEX.HELP", on_help),
+        ("YANDEX.WHAT_CAN_YOU_DO", on_help),
+        (MORNING_BRIEFING, on_morning_briefing),
+        (EVENING_BRIEFING, on_evening_briefing),
+        (ADD_SUBTASK, on_add_subtask),
+        (ADD_CHECKLIST_ITEM, on_add_checklist_item),
+        (CREATE_RECURRING_TASK, on_create_recurring_task),
+        (ADD_REMINDER, on_add_reminder),
+        (CREATE_TASK, on_create_task),
+        (LIST_PROJECTS, on_list_projects),
+        (PROJECT_TASKS, on_project_tasks),
+        (CREATE_PROJECT, on_create_project),
+        (LIST_SUBTASKS, on_list_subtasks),
+        (OVERDUE_TASKS, on_overdue_tasks),
+        (LIST_TASKS, on_list_tasks),
+        (CHECK_ITEM, on_check_item),
+        (COMPLETE_TASK, on_complete_task),
+        (SEARCH_TASK, on_search_task),
+        (SHOW_CHECKLIST, on_show_checklist),
+        (EDIT_TASK, on_edit_task),
+        (DELETE_CHECKLIST_ITEM, on_delete_checklist_item),
+        (DELETE_TASK, on_delete_task),
+    )
+}
+
+
+@router.message(IntentDispatchFilter(_INTENT_HANDLERS))
+async def on_intent(
+    message: Message,
+    intent_name: str,
+    intent_data: dict[str, Any],
+    state: FSMContext | None = None,
+    event_update: Update | None = None,
 ) -> Response:
-    """Handle complete confirmation."""
-    return await handle_complete_confirm(message, state, event_update=event_update)
+    """Dispatch a recognized intent to its handler with a single dict lookup.
 
-
-@router.message(CompleteTaskStates.confirm, IntentFilter("YANDEX.REJECT"))
-async def on_complete_reject(message: Message, state: FSMContext) -> Response:
-    """Handle complete rejection."""
-    return await handle_complete_reject(message, state)
+    Each handler receives only the arguments its signature asks for; the signature
+    is inspected once at import rather than on every call.
+    """
+    route = _INTENT_HANDLERS[intent_name]
+    available = {"intent_data": intent_data, "state": state, "event_update": event_update}
+    return await route.callback(message, **{name: available[name] for name in route.kwargs})
 
 
+# FSM handlers for confirmation states — must be BEFORE the unknown handler.
+# One handler per state branches on the confirm/reject intent itself.
 @router.message(CompleteTaskStates.confirm)
+async def on_complete_confirm_state(
+    message: Message,
+    state: FSMContext,
+    event_update: Update | None = None,
+    nlu_intents: Mapping[str, Any] | None = None,
+) -> Response:
+    """Handle any input while waiting for complete confirmation."""
+    answer = _confirm_answer(message, nlu_intents)
+    if answer == "YANDEX.CONFIRM":
+        return await handle_complete_confirm(message, state, event_update=event_update)
+    if answer == "YANDEX.REJECT":
+        return await handle_complete_reject(message, state)
+    return await on_complete_other(message, state)
+
+
 async def on_complete_other(message: Message, state: FSMContext) -> Response:
     """Handle unexpected input during complete confirmation."""
     tokens = set(message.nlu.tokens or []) if message.nlu else set()
@@ -526,24 +591,28 @@ async def on_complete_other(message: Message, state: FSMContext) -> Response:
         await state.clear()
         return Response(text=txt.COMPLETE_CANCELLED)
 
-    await state.set_data({**data, "_confirm_retries": retries})
+    # get_data returns a copy of the stored dict, so it can be updated in place
+    data["_confirm_retries"] = retries
+    await state.set_data(data)
     return Response(text=txt.COMPLETE_CONFIRM.format(name=data.get("task_name", "")))
 
 
-# FSM handlers for edit confirmation — must be BEFORE the unknown handler
-@router.message(EditTaskStates.confirm, IntentFilter("YANDEX.CONFIRM"))
-async def on_edit_confirm(message: Message, state: FSMContext, event_update: Update) -> Response:
-    """Handle edit confirmation."""
-    return await handle_edit_confirm(message, state, event_update=event_update)
-
-
-@router.message(EditTaskStates.confirm, IntentFilter("YANDEX.REJECT"))
-async def on_edit_reject(message: Message, state: FSMContext) -> Response:
-    """Handle edit rejection."""
-    return await handle_edit_reject(message, state)
+@router.message(EditTaskStates.confirm)
+async def on_edit_confirm_state(
+    message: Message,
+    state: FSMContext,
+    event_update: Update | None = None,
+    nlu_intents: Mapping[str, Any] | None = None,
+) -> Response:
+    """Handle any input while waiting for edit confirmation."""
+    answer = _confirm_answer(message, nlu_intents)
+    if answer == "YANDEX.CONFIRM":
+        return await handle_edit_confirm(message, state, event_update=event_update)
+    if answer == "YANDEX.REJECT":
+        return await handle_edit_reject(message, state)
+    return await on_edit_other(message, state)
 
 
-@router.message(EditTaskStates.confirm)
 async def on_edit_other(message: Message, state: FSMContext) -> Response:
     """Handle unexpected input during edit confirmation."""
     tokens = set(message.nlu.tokens or []) if message.nlu else set()
@@ -561,24 +630,27 @@ async def on_edit_other(message: Message, state: FSMContext) -> Response:
         await state.clear()
         return Response(text=txt.EDIT_CANCELLED)
 
-    await state.set_data({**data, "_confirm_retries": retries})
+    data["_confirm_retries"] = retries
+    await state.set_data(data)
     return Response(text=txt.EDIT_CONFIRM.format(name=data.get("task_name", "")))
 
 
-# FSM handlers for delete confirmation — must be BEFORE the unknown handler
-@router.message(DeleteTaskStates.confirm, IntentFilter("YANDEX.CONFIRM"))
-async def on_delete_confirm(message: Message, state: FSMContext, event_update: Update) -> Response:
-    """Handle delete confirmation."""
-    return await handle_delete_confirm(message, state, event_update=event_update)
-
-
-@router.message(DeleteTaskStates.confirm, IntentFilter("YANDEX.REJECT"))
-async def on_delete_reject(message: Message, state: FSMContext) -> Response:
-    """Handle delete rejection."""
-    return await handle_delete_reject(message, state)
+@router.message(DeleteTaskStates.confirm)
+async def on_delete_confirm_state(
+    message: Message,
+    state: FSMContext,
+    event_update: Update | None = None,
+    nlu_intents: Mapping[str, Any] | None = None,
+) -> Response:
+    """Handle any input while waiting for delete confirmation."""
+    answer = _confirm_answer(message, nlu_intents)
+    if answer == "YANDEX.CONFIRM":
+        return await handle_delete_confirm(message, state, event_update=event_update)
+    if answer == "YANDEX.REJECT":
+        return await handle_delete_reject(message, state)
+    return await on_delete_other(message, state)
 
 
-@router.message(DeleteTaskStates.confirm)
 async def on_delete_other(message: Message, state: FSMContext) -> Response:
     """Handle unexpected input during delete confirmation.
 
@@ -602,7 +674,8 @@ async def on_delete_other(message: Message, state: FSMContext) -> Response:
         await state.clear()
         return Response(text=txt.DELETE_CANCELLED)
 
-    await state.set_data({**data, "_confirm_retries": retries})
+    data["_confirm_retries"] = retries
+    await state.set_data(data)
     return Response(text=txt.DELETE_CONFIRM_PROMPT)
 
 
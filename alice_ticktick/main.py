@@ -19,6 +19,21 @@ dp.include_router(router)
 
 skill = Skill(skill_id=settings.alice_skill_id)
 
+# Fallback bodies are dumped once at import; each use only swaps in the request version
+_FALLBACK_NO_HANDLER = AliceResponse(
+    response=Response(text="Произошла ошибка. Попробуйте ещё раз."),
+    version="1.0",
+).model_dump(exclude_none=True)
+_FALLBACK_ERROR = AliceResponse(
+    response=Response(text="Произошла внутренняя ошибка. Попробуйте позже."),
+    version="1.0",
+).model_dump(exclude_none=True)
+
+
+def _fallback(template: dict[str, Any], event: dict[str, Any]) -> dict[str, Any]:
+    """Return a fresh copy of a prebuilt fallback with the request's version."""
+    return {"response": dict(template["response"]), "version": event.get("version", "1.0")}
+
 
 async def _process_event(event: dict[str, Any]) -> dict[str, Any]:
     """Process a single Alice request and return a response dict."""
@@ -27,11 +42,7 @@ async def _process_event(event: dict[str, Any]) -> dict[str, Any]:
         return response.model_dump(exclude_none=True)
 
     # Fallback response if no handler matched
-    fallback = AliceResponse(
-        response=Response(text="Произошла ошибка. Попробуйте ещё раз."),
-        version=event.get("version", "1.0"),
-    )
-    return fallback.model_dump(exclude_none=True)
+    return _fallback(_FALLBACK_NO_HANDLER, event)
 
 
 async def handler(event: dict[str, Any], context: Any) -> dict[str, Any]:
@@ -52,8 +63,4 @@ async def handler(event: dict[str, Any], context: Any) -> dict[str, Any]:
         return await _process_event(event)
     except Exception:
         logger.exception("Unhandled error in handler")
-        fallback = AliceResponse(
-            response=Response(text="Произошла внутренняя ошибка. Попробуйте позже."),
-            version=event.get("version", "1.0"),
-        )
-        return fallback.model_dump(exclude_none=True)
+        return _fallback(_FALLBACK_ERROR, event)
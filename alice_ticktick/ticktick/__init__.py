@@ -8,10 +8,19 @@ from alice_ticktick.ticktick.client import (
     TickTickServerError,
     TickTickUnauthorizedError,
 )
-from alice_ticktick.ticktick.models import Project, Task, TaskCreate, TaskPriority, TaskUpdate
+from alice_ticktick.ticktick.models import (
+    Project,
+    ProjectData,
+    Task,
+    TaskCreate,
+    TaskPriority,
+    TaskUpdate,
+    format_ticktick_datetime,
+)
 
 __all__ = [
     "Project",
+    "ProjectData",
     "Task",
     "TaskCreate",
     "TaskPriority",
@@ -22,4 +31,5 @@ __all__ = [
     "TickTickRateLimitError",
     "TickTickServerError",
     "TickTickUnauthorizedError",
+    "format_ticktick_datetime",
 ]
@@ -2,23 +2,37 @@
 
 import asyncio
 import logging
+import math
 from typing import Any
 
 import httpx
+from pydantic import TypeAdapter
+from pydantic_core import to_json
 
-from alice_ticktick.ticktick.models import Project, Task, TaskCreate, TaskUpdate
+from alice_ticktick.ticktick.models import Project, ProjectData, Task, TaskCreate, TaskUpdate
 
 BASE_URL = "https://api.ticktick.com/open/v1"
 TIMEOUT = 5.0
 _RATE_LIMIT_RETRIES = 2
 _RATE_LIMIT_BACKOFF = 1.0  # seconds, multiplied by attempt number
+_MAX_RETRY_AFTER = 5.0  # seconds, upper bound for a server-provided Retry-After
+_MAX_CONCURRENT_REQUESTS = 16  # per client, i.e. per user request
 
 logger = logging.getLogger(__name__)
 
+# Validate whole lists in one call, straight from the raw JSON bytes
+_PROJECT_LIST = TypeAdapter(list[Project])
+
+# Request bodies are pre-serialized by pydantic and sent as raw bytes
+_JSON_HEADERS = {"Content-Type": "application/json"}
+
 # Module-level HTTP client for connection reuse across warm invocations.
 # YC Functions reuses the event loop between calls, so async resources survive.
 _shared_http: httpx.AsyncClient | None = None
 
+# Keep idle connections long enough to outlive gaps between warm invocations
+_HTTP_LIMITS = httpx.Limits(max_connections=20, max_keepalive_connections=20, keepalive_expiry=300)
+
 
 def _get_shared_http(access_token: str) -> httpx.AsyncClient:
     """Return a shared httpx client, creating one if needed."""
@@ -28,6 +42,7 @@ def _get_shared_http(access_token: str) -> httpx.AsyncClient:
             base_url=BASE_URL,
             headers={"Authorization": f"Bearer {access_token}"},
             timeout=TIMEOUT,
+            limits=_HTTP_LIMITS,
         )
     else:
         # Update auth header (token might change between invocations)
@@ -60,6 +75,13 @@ class TickTickServerError(TickTickError):
     """5xx Server Error."""
 
 
+_STATUS_ERRORS: dict[int, type[TickTickError]] = {
+    401: TickTickUnauthorizedError,
+    404: TickTickNotFoundError,
+    429: TickTickRateLimitError,
+}
+
+
 def _raise_for_status(response: httpx.Response) -> None:
     """Raise a typed exception for non-2xx responses."""
     if response.is_success:
@@ -68,19 +90,30 @@ def _raise_for_status(response: httpx.Response) -> None:
     code = response.status_code
     text = response.text
 
-    if code == 401:
-        raise TickTickUnauthorizedError(code, text)
-    if code == 404:
-        raise TickTickNotFoundError(code, text)
-    if code == 429:
-        raise TickTickRateLimitError(code, text)
-    if code >= 500:
-        # TickTick returns 500 with errorCode "exceed_query" for rate limiting
-        if "exceed_query" in text:
-            raise TickTickRateLimitError(code, text)
-        raise TickTickServerError(code, text)
-
-    raise TickTickError(code, text)
+    exc_cls = _STATUS_ERRORS.get(code)
+    if exc_cls is None:
+        if code >= 500:
+            # TickTick returns 500 with errorCode "exceed_query" for rate limiting
+            exc_cls = TickTickRateLimitError if "exceed_query" in text else TickTickServerError
+        else:
+            exc_cls = TickTickError
+    raise exc_cls(code, text)
+
+
+def _retry_after(response: httpx.Response) -> float | None:
+    """Return the Retry-After delay in seconds, if the server sent one."""
+    value = response.headers.get("Retry-After")
+    if value is None:
+        return None
+    try:
+        delay = float(value)
+    except ValueError:
+        # HTTP-date form is not used by TickTick; fall back to the default backoff
+        return None
+    if not math.isfinite(delay):
+        # float() accepts "nan"/"inf", which asyncio.sleep would reject
+        return None
+    return min(max(delay, 0.0), _MAX_RETRY_AFTER)
 
 
 class TickTickClient:
@@ -88,6 +121,9 @@ class TickTickClient:
 
     def __init__(self, access_token: str) -> None:
         self._client = _get_shared_http(access_token)
+        # Per client: TickTick rate-limits per token, and one user's project fan-out
+        # should run in a single wave. The shared pool (_HTTP_LIMITS) bounds the process.
+        self._semaphore = asyncio.Semaphore(_MAX_CONCURRENT_REQUESTS)
 
     async def _request(
         self,
@@ -97,12 +133,16 @@ class TickTickClient:
     ) -> httpx.Response:
         """Send HTTP request with retry on rate limit (exceed_query)."""
         for attempt in range(_RATE_LIMIT_RETRIES + 1):
-            response = await self._client.request(method, url, **kwargs)
+            # The semaphore is released before any backoff sleep
+            async with self._semaphore:
+                response = await self._client.request(method, url, **kwargs)
             try:
                 _raise_for_status(response)
             except TickTickRateLimitError:
                 if attempt < _RATE_LIMIT_RETRIES:
-                    delay = _RATE_LIMIT_BACKOFF * (attempt + 1)
+                    delay = _retry_after(response)
+                    if delay is None:
+                        delay = _RATE_LIMIT_BACKOFF * (attempt + 1)
                     logger.warning(
                         "Rate limited (attempt %d/%d), retrying in %.1fs",
                         attempt + 1,
@@ -129,12 +169,14 @@ class TickTickClient:
     async def get_projects(self) -> list[Project]:
         """Get all user projects."""
         response = await self._request("GET", "/project")
-        return [Project.model_validate(p) for p in response.json()]
+        return _PROJECT_LIST.validate_json(response.content)
 
     async def create_project(self, name: str) -> Project:
         """Create a new project."""
-        response = await self._request("POST", "/project", json={"name": name})
-        return Project.model_validate(response.json())
+        response = await self._request(
+            "POST", "/project", content=to_json({"name": name}), headers=_JSON_HEADERS
+        )
+        return Project.model_validate_json(response.content)
 
     async def delete_project(self, project_id: str) -> None:
         """Delete a project."""
@@ -145,41 +187,39 @@ class TickTickClient:
     async def get_inbox_tasks(self) -> list[Task]:
         """Get tasks from inbox (not included in get_projects)."""
         response = await self._request("GET", "/project/inbox/data")
-        data: dict[str, Any] = response.json()
-        raw_tasks: list[dict[str, Any]] = data.get("tasks", [])
-        return [Task.model_validate(t) for t in raw_tasks]
+        return ProjectData.model_validate_json(response.content).tasks
 
     # -- Tasks --
 
     async def get_tasks(self, project_id: str) -> list[Task]:
         """Get all tasks in a project."""
         response = await self._request("GET", f"/project/{project_id}/data")
-        data: dict[str, Any] = response.json()
-        raw_tasks: list[dict[str, Any]] = data.get("tasks", [])
-        return [Task.model_validate(t) for t in raw_tasks]
+        return ProjectData.model_validate_json(response.content).tasks
 
     async def get_task(self, task_id: str, project_id: str) -> Task:
         """Get a single task by id."""
         response = await self._request("GET", f"/project/{project_id}/task/{task_id}")
-        return Task.model_validate(response.json())
+        return Task.model_validate_json(response.content)
 
     async def create_task(self, payload: TaskCreate) -> Task:
         """Create a new task."""
         response = await self._request(
             "POST",
             "/task",
-            json=payload.model_dump(by_alias=True, exclude_none=True),
+            content=payload.model_dump_json(by_alias=True, exclude_none=True).encode(),
+            headers=_JSON_HEADERS,
         )
-        return Task.model_validate(response.json())
+        return Task.model_validate_json(response.content)
 
     async def update_task(self, payload: TaskUpdate) -> Task:
         """Update an existing task."""
         response = await self._request(
             "POST",
             f"/task/{payload.id}",
-            json=payload.model_dump(by_alias=True, exclude_none=True),
+            content=payload.model_dump_json(by_alias=True, exclude_none=True).encode(),
+            headers=_JSON_HEADERS,
         )
-        return Task.model_validate(response.json())
+        return Task.model_validate_json(response.content)
 
     async def delete_task(self, task_id: str, project_id: str) -> None:
         """Delete a task."""
@@ -190,13 +230,16 @@ class TickTickClient:
         await self._request(
             "POST",
             "/task/move",
-            json=[
-                {
-                    "taskId": task_id,
-                    "fromProjectId": from_project_id,
-                    "toProjectId": to_project_id,
-                }
-            ],
+            content=to_json(
+                [
+                    {
+                        "taskId": task_id,
+                        "fromProjectId": from_project_id,
+                        "toProjectId": to_project_id,
+                    }
+                ]
+            ),
+            headers=_JSON_HEADERS,
         )
 
     async def complete_task(self, task_id: str, project_id: str) -> None:
@@ -4,7 +4,20 @@ from datetime import datetime
 from enum import IntEnum
 from typing import Any
 
-from pydantic import BaseModel, Field, field_serializer
+from pydantic import BaseModel, ConfigDict, Field, field_serializer
+from pydantic.alias_generators import to_camel
+from pydantic.dataclasses import dataclass
+
+# One config object shared by every model: camelCase API aliases generated from the
+# field names (populate_by_name keeps snake_case input working), immutable instances.
+_MODEL_CONFIG = ConfigDict(alias_generator=to_camel, populate_by_name=True, frozen=True)
+
+
+def format_ticktick_datetime(value: datetime) -> str:
+    """Format a datetime the way the TickTick API expects (2026-03-05T09:00:00.000+0300)."""
+    # Same output as strftime("%Y-%m-%dT%H:%M:%S.000%z"), via the faster isoformat path
+    iso = value.isoformat(timespec="seconds")
+    return f"{iso[:19]}.000{iso[19:].replace(':', '')}"
 
 
 class TaskPriority(IntEnum):
@@ -16,34 +29,35 @@ class TaskPriority(IntEnum):
     HIGH = 5
 
 
-class ChecklistItem(BaseModel):
+# A slotted dataclass rather than a BaseModel: tasks can carry hundreds of items and
+# the per-instance __dict__ / fields-set bookkeeping is most of an item's footprint.
+@dataclass(config=_MODEL_CONFIG, slots=True, kw_only=True)
+class ChecklistItem:
     """A single checklist item within a task."""
 
     id: str = ""
     title: str
     status: int = 0  # 0 = incomplete, 1 = completed
-    sort_order: int = Field(default=0, alias="sortOrder")
-
-    model_config = {"populate_by_name": True}
+    sort_order: int = 0
 
 
 class Task(BaseModel):
     """TickTick task."""
 
     id: str
-    project_id: str = Field(alias="projectId")
+    project_id: str
     title: str
     content: str = ""
     priority: TaskPriority = TaskPriority.NONE
     status: int = 0
-    due_date: datetime | None = Field(default=None, alias="dueDate")
-    start_date: datetime | None = Field(default=None, alias="startDate")
+    due_date: datetime | None = None
+    start_date: datetime | None = None
     items: list[ChecklistItem] = Field(default_factory=list)
-    parent_id: str | None = Field(default=None, alias="parentId")
-    repeat_flag: str | None = Field(default=None, alias="repeatFlag")
+    parent_id: str | None = None
+    repeat_flag: str | None = None
     reminders: list[str] = Field(default_factory=list)
 
-    model_config = {"populate_by_name": True}
+    model_config = _MODEL_CONFIG
 
 
 class Project(BaseModel):
@@ -53,40 +67,50 @@ class Project(BaseModel):
     name: str
     closed: bool | None = None
 
+    model_config = _MODEL_CONFIG
+
+
+class ProjectData(BaseModel):
+    """Response of the project data endpoint (only tasks are used)."""
+
+    tasks: list[Task] = Field(default_factory=list)
+
+    model_config = _MODEL_CONFIG
+
 
 class TaskCreate(BaseModel):
     """Payload for creating a task."""
 
     title: str
-    project_id: str | None = Field(default=None, alias="projectId")
+    project_id: str | None = None
     content: str = ""
     priority: TaskPriority = TaskPriority.NONE
-    due_date: str | None = Field(default=None, alias="dueDate")
-    start_date: str | None = Field(default=None, alias="startDate")
-    is_all_day: bool | None = Field(default=None, alias="isAllDay")
+    due_date: str | None = None
+    start_date: str | None = None
+    is_all_day: bool | None = None
     items: list[dict[str, Any]] | None = None
-    parent_id: str | None = Field(default=None, alias="parentId")
-    repeat_flag: str | None = Field(default=None, alias="repeatFlag")
+    parent_id: str | None = None
+    repeat_flag: str | None = None
     reminders: list[str] | None = None
 
-    model_config = {"populate_by_name": True}
+    model_config = _MODEL_CONFIG
 
 
 class TaskUpdate(BaseModel):
     """Payload for updating a task."""
 
     id: str
-    project_id: str = Field(alias="projectId")
+    project_id: str
     title: str | None = None
     priority: TaskPriority | None = None
-    start_date: datetime | None = Field(default=None, alias="startDate")
-    due_date: datetime | None = Field(default=None, alias="dueDate")
-    is_all_day: bool | None = Field(default=None, alias="isAllDay")
+    start_date: datetime | None = None
+    due_date: datetime | None = None
+    is_all_day: bool | None = None
     items: list[dict[str, Any]] | None = None
-    repeat_flag: str | None = Field(default=None, alias="repeatFlag")
+    repeat_flag: str | None = None
     reminders: list[str] | None = None
 
-    model_config = {"populate_by_name": True}
+    model_config = _MODEL_CONFIG
 
     @field_serializer("start_date", "due_date")
     @classmethod
@@ -94,4 +118,4 @@ class TaskUpdate(BaseModel):
         """Format datetime to TickTick API format."""
         if value is None:
             return None
-        return value.strftime("%Y-%m-%dT%H:%M:%S.000%z")
+        return format_ticktick_datetime(value)
@@ -5,7 +5,7 @@ from __future__ import annotations
 from typing import Any
 from unittest.mock import MagicMock
 
-from alice_ticktick.dialogs.filters import IntentFilter, NewSessionFilter
+from alice_ticktick.dialogs.filters import IntentDispatchFilter, IntentFilter, NewSessionFilter
 
 
 def _make_message(
@@ -54,11 +54,48 @@ class TestIntentFilter:
         result = await f(message)
         assert result is False
 
+    async def test_uses_middleware_intents(self) -> None:
+        f = IntentFilter("create_task")
+        message = _make_message(has_nlu=False)
+        result = await f(message, nlu_intents={"create_task": {"slots": {}}})
+        assert result == {"intent_data": {"slots": {}}}
+
     def test_repr(self) -> None:
         f = IntentFilter("create_task")
         assert "create_task" in repr(f)
 
 
+class TestIntentDispatchFilter:
+    async def test_match(self) -> None:
+        f = IntentDispatchFilter(["create_task", "list_tasks"])
+        message = _make_message(intents={"list_tasks": {"slots": {"date": {}}}})
+        result = await f(message)
+        assert result == {"intent_name": "list_tasks", "intent_data": {"slots": {"date": {}}}}
+
+    async def test_highest_priority_wins(self) -> None:
+        f = IntentDispatchFilter(["add_subtask", "create_task"])
+        message = _make_message(intents={"create_task": {"slots": {}}, "add_subtask": {}})
+        result = await f(message)
+        assert isinstance(result, dict)
+        assert result["intent_name"] == "add_subtask"
+
+    async def test_unknown_intents_ignored(self) -> None:
+        f = IntentDispatchFilter(["create_task"])
+        message = _make_message(intents={"YANDEX.CONFIRM": {}})
+        result = await f(message)
+        assert result is False
+
+    async def test_no_nlu(self) -> None:
+        f = IntentDispatchFilter(["create_task"])
+        message = _make_message(has_nlu=False)
+        result = await f(message)
+        assert result is False
+
+    def test_repr(self) -> None:
+        f = IntentDispatchFilter(["create_task", "list_tasks"])
+        assert "2 intents" in repr(f)
+
+
 class TestNewSessionFilter:
     async def test_new_session(self) -> None:
         f = NewSessionFilter()
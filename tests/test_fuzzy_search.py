@@ -105,3 +105,29 @@ class TestFindMatches:
 
     def test_empty_candidates(self) -> None:
         assert find_matches("запрос", []) == []
+
+
+class TestTokenSortEquivalence:
+    """Cached sort keys + ratio must score exactly like token_sort_ratio."""
+
+    def test_scores_match_token_sort_ratio(self) -> None:
+        from rapidfuzz import fuzz
+        from rapidfuzz import utils as rf_utils
+
+        candidates = [
+            "Купить молоко и хлеб!",
+            "  позвонить маме ",
+            "Отчёт по проекту, сдать",
+            "Read the BOOK",
+            "x-y встреча",
+        ]
+        query = "хлеб, молоко купить"
+        results = find_matches(query, candidates, threshold=0, limit=len(candidates))
+        assert len(results) == len(candidates)
+        for title, score, idx in results:
+            assert title == candidates[idx]
+            expected = fuzz.token_sort_ratio(query, title, processor=rf_utils.default_process)
+            assert score == expected
+
+    def test_punctuation_only_query(self) -> None:
+        assert find_best_match("?!", ["Купить молоко"]) is None
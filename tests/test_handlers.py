@@ -2,7 +2,9 @@
 
 from __future__ import annotations
 
+import asyncio
 import datetime
+from types import SimpleNamespace
 from typing import Any
 from unittest.mock import AsyncMock, MagicMock
 from zoneinfo import ZoneInfo
@@ -16,6 +18,7 @@ from alice_ticktick.dialogs.handlers import (
     _format_priority_label,
     _format_priority_short,
     _format_task_context,
+    _gather_all_tasks,
     _reset_project_cache,
     _truncate_response,
     handle_add_reminder,
@@ -35,9 +38,13 @@ from alice_ticktick.dialogs.handlers import (
     handle_unknown,
     handle_welcome,
 )
-from alice_ticktick.dialogs.router import _MAX_CONFIRM_RETRIES, on_delete_other
+from alice_ticktick.dialogs.router import (
+    _MAX_CONFIRM_RETRIES,
+    on_delete_confirm_state,
+    on_delete_other,
+)
 from alice_ticktick.dialogs.states import DeleteTaskStates
-from alice_ticktick.ticktick.client import TickTickUnauthorizedError
+from alice_ticktick.ticktick.client import TickTickClient, TickTickUnauthorizedError
 from alice_ticktick.ticktick.models import ChecklistItem, Project, Task
 
 
@@ -53,28 +60,37 @@ def _make_message(
     new: bool = False,
     command: str = "",
     intents: dict[str, Any] | None = None,
-) -> MagicMock:
-    """Create a mock Message object."""
-    message = MagicMock()
-    message.command = command
-    message.original_utterance = command
-    message.session.new = new
-    message.session.session_id = "test-session-id"
-    message.session.skill_id = "test-skill-id"
-
-    if access_token is not None:
-        message.user = MagicMock()
-        message.user.access_token = access_token
-    else:
-        message.user = None
-
-    if intents is not None:
-        message.nlu = MagicMock()
-        message.nlu.intents = intents
-    else:
-        message.nlu = None
+) -> Any:
+    """Create a stand-in Message object.
 
-    return message
+    Plain namespaces instead of MagicMock: handlers only read attributes, and a
+    mock per test is the bulk of the setup cost.
+    """
+    return SimpleNamespace(
+        command=command,
+        original_utterance=command,
+        session=SimpleNamespace(new=new, session_id="test-session-id", skill_id="test-skill-id"),
+        user=SimpleNamespace(access_token=access_token) if access_token is not None else None,
+        nlu=(
+            SimpleNamespace(intents=intents, tokens=[], entities=[])
+            if intents is not None
+            else None
+        ),
+    )
+
+
+def _make_update(
+    *,
+    timezone: str = "Europe/Moscow",
+    account_linking: dict[str, Any] | None = None,
+) -> Any:
+    """Create a stand-in Update carrying only the meta fields handlers read."""
+    return SimpleNamespace(
+        meta=SimpleNamespace(
+            timezone=timezone,
+            interfaces=SimpleNamespace(account_linking=account_linking),
+        )
+    )
 
 
 def _make_task(
@@ -124,6 +140,16 @@ def _make_state(data: dict[str, Any] | None = None) -> AsyncMock:
     return state
 
 
+def _make_mock_state(data: dict[str, Any] | None = None) -> AsyncMock:
+    """Create a mock FSMContext whose get_data always returns *data*."""
+    state = AsyncMock()
+    state.get_data = AsyncMock(return_value=data or {})
+    state.set_data = AsyncMock()
+    state.set_state = AsyncMock()
+    state.clear = AsyncMock()
+    return state
+
+
 def _make_mock_client(
     projects: list[Project] | None = None,
     tasks: list[Task] | None = None,
@@ -134,7 +160,7 @@ def _make_mock_client(
     if tasks is None:
         tasks = []
 
-    client = AsyncMock()
+    client = AsyncMock(spec=TickTickClient)
     client.get_projects = AsyncMock(return_value=projects)
     client.get_tasks = AsyncMock(return_value=tasks)
     client.get_inbox_tasks = AsyncMock(return_value=[])
@@ -151,6 +177,14 @@ def _make_mock_client(
     return factory
 
 
+def _make_failing_client(error: Exception | None = None) -> MagicMock:
+    """Create a mock TickTickClient factory whose ``async with`` raises *error*."""
+    factory = MagicMock()
+    factory.return_value.__aenter__ = AsyncMock(side_effect=error or Exception("API error"))
+    factory.return_value.__aexit__ = AsyncMock(return_value=None)
+    return factory
+
+
 # --- Welcome / Help ---
 
 
@@ -214,8 +248,7 @@ async def test_auth_required_no_linking_when_no_update() -> None:
 
 async def test_auth_required_no_linking_when_no_interfaces() -> None:
     """When meta.interfaces.account_linking is None, returns NO_LINKING."""
-    mock_update = MagicMock()
-    mock_update.meta.interfaces.account_linking = None
+    mock_update = _make_update()
     response = _auth_required_response(mock_update)
     assert response.text == txt.AUTH_REQUIRED_NO_LINKING
     assert response.directives is None
@@ -223,8 +256,7 @@ async def test_auth_required_no_linking_when_no_interfaces() -> None:
 
 async def test_auth_required_with_linking() -> None:
     """When account_linking is supported, returns LINKING text and directive."""
-    mock_update = MagicMock()
-    mock_update.meta.interfaces.account_linking = {}
+    mock_update = _make_update(account_linking={})
     response = _auth_required_response(mock_update)
     assert response.text == txt.AUTH_REQUIRED_LINKING
     assert response.directives is not None
@@ -234,65 +266,51 @@ async def test_auth_required_with_linking() -> None:
 # --- Auth required ---
 
 
-async def test_create_task_auth_required() -> None:
-    message = _make_message(access_token=None)
-    intent_data: dict[str, Any] = {"slots": {}}
-    response = await handle_create_task(message, intent_data)
-    assert response.text == txt.AUTH_REQUIRED_NO_LINKING
-
-
-async def test_list_tasks_auth_required() -> None:
-    message = _make_message(access_token=None)
-    intent_data: dict[str, Any] = {"slots": {}}
-    response = await handle_list_tasks(message, intent_data)
-    assert response.text == txt.AUTH_REQUIRED_NO_LINKING
-
-
-async def test_overdue_tasks_auth_required() -> None:
-    message = _make_message(access_token=None)
-    response = await handle_overdue_tasks(message)
-    assert response.text == txt.AUTH_REQUIRED_NO_LINKING
-
-
-async def test_complete_task_auth_required() -> None:
-    message = _make_message(access_token=None)
-    intent_data: dict[str, Any] = {"slots": {}}
-    response = await handle_complete_task(message, intent_data, _make_state())
-    assert response.text == txt.AUTH_REQUIRED_NO_LINKING
-
-
-async def test_search_task_auth_required() -> None:
-    message = _make_message(access_token=None)
-    intent_data: dict[str, Any] = {"slots": {}}
-    response = await handle_search_task(message, intent_data)
-    assert response.text == txt.AUTH_REQUIRED_NO_LINKING
-
-
-async def test_edit_task_auth_required() -> None:
+@pytest.mark.parametrize(
+    "handler, needs_intent, needs_state",
+    [
+        (handle_create_task, True, False),
+        (handle_list_tasks, True, False),
+        (handle_overdue_tasks, False, False),
+        (handle_complete_task, True, True),
+        (handle_search_task, True, False),
+        (handle_edit_task, True, True),
+        (handle_delete_task, True, True),
+    ],
+)
+async def test_handler_auth_required(handler: Any, needs_intent: bool, needs_state: bool) -> None:
     message = _make_message(access_token=None)
-    intent_data: dict[str, Any] = {"slots": {}}
-    response = await handle_edit_task(message, intent_data, _make_state())
+    args: list[Any] = [message]
+    if needs_intent:
+        args.append({"slots": {}})
+    if needs_state:
+        args.append(_make_state())
+    response = await handler(*args)
     assert response.text == txt.AUTH_REQUIRED_NO_LINKING
 
 
-async def test_delete_task_auth_required() -> None:
-    message = _make_message(access_token=None)
-    intent_data: dict[str, Any] = {"slots": {}}
-    state = _make_mock_state()
-    response = await handle_delete_task(message, intent_data, state)
-    assert response.text == txt.AUTH_REQUIRED_NO_LINKING
+@pytest.mark.parametrize(
+    "handler, needs_state, expected",
+    [
+        (handle_create_task, False, txt.TASK_NAME_REQUIRED),
+        (handle_complete_task, True, txt.COMPLETE_NAME_REQUIRED),
+        (handle_search_task, False, txt.SEARCH_QUERY_REQUIRED),
+        (handle_edit_task, True, txt.EDIT_NAME_REQUIRED),
+        (handle_delete_task, True, txt.DELETE_NAME_REQUIRED),
+    ],
+)
+async def test_handler_name_required(handler: Any, needs_state: bool, expected: str) -> None:
+    message = _make_message()
+    args: list[Any] = [message, {"slots": {}}]
+    if needs_state:
+        args.append(_make_state())
+    response = await handler(*args)
+    assert response.text == expected
 
 
 # --- Create task ---
 
 
-async def test_create_task_name_required() -> None:
-    message = _make_message()
-    intent_data: dict[str, Any] = {"slots": {}}
-    response = await handle_create_task(message, intent_data)
-    assert response.text == txt.TASK_NAME_REQUIRED
-
-
 async def test_create_task_name_is_stopword_asks_for_name() -> None:
     """Если task_name — это только слово 'задачу', переспросить название."""
     message = _make_message(command="создай задачу")
@@ -411,8 +429,9 @@ async def test_create_task_with_time_range() -> None:
     assert call_args.due_date is not None
     assert call_args.start_date != call_args.due_date
     # start should be 19:00, end should be 21:30
-    start_dt = datetime.datetime.strptime(call_args.start_date, "%Y-%m-%dT%H:%M:%S.000+0300")
-    end_dt = datetime.datetime.strptime(call_args.due_date, "%Y-%m-%dT%H:%M:%S.000+0300")
+    start_dt = datetime.datetime.fromisoformat(call_args.start_date)
+    end_dt = datetime.datetime.fromisoformat(call_args.due_date)
+    assert start_dt.utcoffset() == end_dt.utcoffset() == datetime.timedelta(hours=3)
     assert start_dt.hour == 19
     assert end_dt.hour == 21
     assert end_dt.minute == 30
@@ -501,10 +520,7 @@ async def test_create_task_api_error() -> None:
     intent_data: dict[str, Any] = {
         "slots": {"task_name": {"value": "Тест"}},
     }
-    mock_factory = _make_mock_client()
-    mock_factory.return_value.__aenter__ = AsyncMock(
-        side_effect=Exception("API error"),
-    )
+    mock_factory = _make_failing_client()
     response = await handle_create_task(message, intent_data, mock_factory)
     assert response.text == txt.CREATE_ERROR
 
@@ -566,10 +582,7 @@ async def test_list_tasks_for_specific_date() -> None:
 async def test_list_tasks_api_error() -> None:
     message = _make_message()
     intent_data: dict[str, Any] = {"slots": {}}
-    mock_factory = _make_mock_client()
-    mock_factory.return_value.__aenter__ = AsyncMock(
-        side_effect=Exception("API error"),
-    )
+    mock_factory = _make_failing_client()
     response = await handle_list_tasks(message, intent_data, mock_factory)
     assert "Произошла ошибка при обращении к TickTick" in response.text
 
@@ -699,10 +712,7 @@ async def test_overdue_tasks_found() -> None:
 
 async def test_overdue_tasks_api_error() -> None:
     message = _make_message()
-    mock_factory = _make_mock_client()
-    mock_factory.return_value.__aenter__ = AsyncMock(
-        side_effect=Exception("API error"),
-    )
+    mock_factory = _make_failing_client()
     response = await handle_overdue_tasks(message, ticktick_client_factory=mock_factory)
     assert "Произошла ошибка при обращении к TickTick" in response.text
 
@@ -710,13 +720,6 @@ async def test_overdue_tasks_api_error() -> None:
 # --- Complete task ---
 
 
-async def test_complete_task_name_required() -> None:
-    message = _make_message()
-    intent_data: dict[str, Any] = {"slots": {}}
-    response = await handle_complete_task(message, intent_data, _make_state())
-    assert response.text == txt.COMPLETE_NAME_REQUIRED
-
-
 async def test_complete_task_success() -> None:
     tasks = [_make_task(title="Купить молоко")]
     message = _make_message()
@@ -756,10 +759,7 @@ async def test_complete_task_api_error() -> None:
     intent_data: dict[str, Any] = {
         "slots": {"task_name": {"value": "Тест"}},
     }
-    mock_factory = _make_mock_client()
-    mock_factory.return_value.__aenter__ = AsyncMock(
-        side_effect=Exception("API error"),
-    )
+    mock_factory = _make_failing_client()
     response = await handle_complete_task(message, intent_data, _make_state(), mock_factory)
     assert response.text == txt.COMPLETE_ERROR
 
@@ -768,34 +768,27 @@ async def test_complete_task_api_error() -> None:
 
 
 class TestPluralizeTask:
-    def test_one(self) -> None:
-        assert txt.pluralize_tasks(1) == "1 задача"
-
-    def test_two(self) -> None:
-        assert txt.pluralize_tasks(2) == "2 задачи"
-
-    def test_five(self) -> None:
-        assert txt.pluralize_tasks(5) == "5 задач"
-
-    def test_eleven(self) -> None:
-        assert txt.pluralize_tasks(11) == "11 задач"
-
-    def test_twenty_one(self) -> None:
-        assert txt.pluralize_tasks(21) == "21 задача"
-
-    def test_twenty_two(self) -> None:
-        assert txt.pluralize_tasks(22) == "22 задачи"
+    @pytest.mark.parametrize(
+        "count, expected",
+        [
+            (1, "1 задача"),
+            (2, "2 задачи"),
+            (5, "5 задач"),
+            (11, "11 задач"),
+            (21, "21 задача"),
+            (22, "22 задачи"),
+        ],
+    )
+    def test_pluralize(self, count: int, expected: str) -> None:
+        assert txt.pluralize_tasks(count) == expected
 
 
 # --- Truncation ---
 
 
 class TestTruncateResponse:
-    def test_short_text_unchanged(self) -> None:
-        assert _truncate_response("hello") == "hello"
-
-    def test_exact_limit_unchanged(self) -> None:
-        text = "a" * ALICE_RESPONSE_MAX_LENGTH
+    @pytest.mark.parametrize("text", ["hello", "a" * ALICE_RESPONSE_MAX_LENGTH])
+    def test_within_limit_unchanged(self, text: str) -> None:
         assert _truncate_response(text) == text
 
     def test_long_text_truncated(self) -> None:
@@ -926,8 +919,7 @@ async def test_list_tasks_timezone_filter() -> None:
     }
 
     # Build a mock Update with Europe/Moscow timezone
-    mock_update = MagicMock()
-    mock_update.meta.timezone = "Europe/Moscow"
+    mock_update = _make_update()
 
     response = await handle_list_tasks(
         message,
@@ -962,8 +954,7 @@ async def test_list_tasks_timezone_filter_matches() -> None:
         },
     }
 
-    mock_update = MagicMock()
-    mock_update.meta.timezone = "Europe/Moscow"
+    mock_update = _make_update()
 
     response = await handle_list_tasks(
         message,
@@ -974,29 +965,9 @@ async def test_list_tasks_timezone_filter_matches() -> None:
     assert "Tomorrow Task" in response.text
 
 
-# --- FSM state helper ---
-
-
-def _make_mock_state(data: dict[str, Any] | None = None) -> AsyncMock:
-    """Create a mock FSMContext."""
-    state = AsyncMock()
-    state.get_data = AsyncMock(return_value=data or {})
-    state.set_data = AsyncMock()
-    state.set_state = AsyncMock()
-    state.clear = AsyncMock()
-    return state
-
-
 # --- Search task ---
 
 
-async def test_search_task_query_required() -> None:
-    message = _make_message()
-    intent_data: dict[str, Any] = {"slots": {}}
-    response = await handle_search_task(message, intent_data)
-    assert response.text == txt.SEARCH_QUERY_REQUIRED
-
-
 async def test_search_task_success() -> None:
     tasks = [
         _make_task(title="Купить молоко"),
@@ -1029,10 +1000,7 @@ async def test_search_task_api_error() -> None:
     intent_data: dict[str, Any] = {
         "slots": {"query": {"value": "тест"}},
     }
-    mock_factory = _make_mock_client()
-    mock_factory.return_value.__aenter__ = AsyncMock(
-        side_effect=Exception("API error"),
-    )
+    mock_factory = _make_failing_client()
     response = await handle_search_task(message, intent_data, mock_factory)
     assert "Произошла ошибка при обращении к TickTick" in response.text
 
@@ -1040,13 +1008,6 @@ async def test_search_task_api_error() -> None:
 # --- Edit task ---
 
 
-async def test_edit_task_name_required() -> None:
-    message = _make_message()
-    intent_data: dict[str, Any] = {"slots": {}}
-    response = await handle_edit_task(message, intent_data, _make_state())
-    assert response.text == txt.EDIT_NAME_REQUIRED
-
-
 async def test_edit_task_no_changes() -> None:
     message = _make_message()
     intent_data: dict[str, Any] = {
@@ -1208,10 +1169,7 @@ async def test_edit_task_fetch_api_error() -> None:
             "new_priority": {"value": "высокий"},
         },
     }
-    mock_factory = _make_mock_client()
-    mock_factory.return_value.__aenter__ = AsyncMock(
-        side_effect=Exception("API error"),
-    )
+    mock_factory = _make_failing_client()
     response = await handle_edit_task(message, intent_data, _make_state(), mock_factory)
     assert "Произошла ошибка при обращении к TickTick" in response.text
 
@@ -1331,8 +1289,7 @@ async def test_create_task_date_only_uses_user_timezone() -> None:
         "slots": {"task_name": {"value": "Купить молоко"}},
     }
     # Create event_update with Moscow timezone
-    event_update = MagicMock()
-    event_update.meta.timezone = "Europe/Moscow"
+    event_update = _make_update()
 
     mock_factory = _make_mock_client()
     response = await handle_create_task(message, intent_data, mock_factory, event_update)
@@ -1365,8 +1322,7 @@ async def test_create_task_with_time_uses_user_timezone() -> None:
     intent_data: dict[str, Any] = {
         "slots": {"task_name": {"value": "Кино"}},
     }
-    event_update = MagicMock()
-    event_update.meta.timezone = "Europe/Moscow"
+    event_update = _make_update()
 
     mock_factory = _make_mock_client()
     response = await handle_create_task(message, intent_data, mock_factory, event_update)
@@ -1461,14 +1417,6 @@ async def test_create_task_only_date_in_slot_returns_name_required() -> None:
 # --- Delete task ---
 
 
-async def test_delete_task_name_required() -> None:
-    message = _make_message()
-    intent_data: dict[str, Any] = {"slots": {}}
-    state = _make_mock_state()
-    response = await handle_delete_task(message, intent_data, state)
-    assert response.text == txt.DELETE_NAME_REQUIRED
-
-
 async def test_delete_task_starts_confirmation() -> None:
     tasks = [_make_task(title="Купить молоко", task_id="t1", project_id="p1")]
     message = _make_message()
@@ -1515,8 +1463,7 @@ async def test_delete_confirm_api_error() -> None:
     state = _make_mock_state(
         data={"task_id": "t1", "project_id": "p1", "task_name": "Купить молоко"}
     )
-    mock_factory = _make_mock_client()
-    mock_factory.return_value.__aenter__ = AsyncMock(side_effect=Exception("API error"))
+    mock_factory = _make_failing_client()
     response = await handle_delete_confirm(message, state, mock_factory)
     assert response.text == txt.DELETE_ERROR
     state.clear.assert_called_once()
@@ -1549,8 +1496,7 @@ async def test_delete_task_api_error() -> None:
         "slots": {"task_name": {"value": "тест"}},
     }
     state = _make_mock_state()
-    mock_factory = _make_mock_client()
-    mock_factory.return_value.__aenter__ = AsyncMock(side_effect=Exception("API error"))
+    mock_factory = _make_failing_client()
     response = await handle_delete_task(message, intent_data, state, mock_factory)
     assert "Произошла ошибка при обращении к TickTick" in response.text
 
@@ -1616,6 +1562,39 @@ async def test_delete_other_handles_otmena_as_reject() -> None:
     state.clear.assert_called_once()
 
 
+@pytest.mark.parametrize(
+    "intents, handler_name",
+    [
+        ({"YANDEX.CONFIRM": {}}, "handle_delete_confirm"),
+        ({"YANDEX.REJECT": {}}, "handle_delete_reject"),
+        ({"YANDEX.CONFIRM": {}, "YANDEX.REJECT": {}}, "handle_delete_confirm"),
+    ],
+)
+async def test_delete_confirm_state_branches_on_intent(
+    intents: dict[str, Any], handler_name: str
+) -> None:
+    """The single delete-confirm handler routes CONFIRM/REJECT without extra filters."""
+    from unittest.mock import patch
+
+    from aliceio.types import Response as AliceResponse
+
+    message = _make_message()
+    state = _make_mock_state(data={"task_id": "t1", "project_id": "p1"})
+    with patch(f"alice_ticktick.dialogs.router.{handler_name}", new_callable=AsyncMock) as mock:
+        mock.return_value = AliceResponse(text="ok")
+        response = await on_delete_confirm_state(message, state, nlu_intents=intents)
+    assert response.text == "ok"
+    mock.assert_awaited_once()
+
+
+async def test_delete_confirm_state_falls_back_to_other() -> None:
+    """Without confirm/reject intents, unexpected input re-prompts."""
+    message = _make_message(intents={})
+    state = _make_mock_state(data={"task_id": "t1", "project_id": "p1"})
+    response = await on_delete_confirm_state(message, state)
+    assert response.text == txt.DELETE_CONFIRM_PROMPT
+
+
 # --- Search edge cases ---
 
 
@@ -2117,8 +2096,7 @@ async def test_router_disambiguate_add_subtask_vs_create_task_in_project() -> No
         },
     }
     mock_factory = _make_mock_client(projects=projects)
-    event_update = MagicMock()
-    event_update.meta.timezone = "UTC"
+    event_update = _make_update(timezone="UTC")
     from unittest.mock import patch
 
     with patch("alice_ticktick.dialogs.handlers.tasks.TickTickClient", mock_factory):
@@ -2130,6 +2108,29 @@ async def test_router_disambiguate_add_subtask_vs_create_task_in_project() -> No
     assert "не найдена" not in response.text
 
 
+async def test_router_add_subtask_kept_when_subtask_keyword_present() -> None:
+    """When both intents match but the utterance says 'подзадачу', keep add_subtask."""
+    from unittest.mock import patch
+
+    from alice_ticktick.dialogs.router import on_add_subtask
+
+    message = _make_message(intents={"add_subtask": {"slots": {}}, "create_task": {"slots": {}}})
+    message.nlu.tokens = ["добавь", "подзадачу", "молоко", "к", "задаче", "покупки"]
+
+    with (
+        patch(
+            "alice_ticktick.dialogs.router.handle_add_subtask", new_callable=AsyncMock
+        ) as mock_subtask,
+        patch(
+            "alice_ticktick.dialogs.router.handle_create_task", new_callable=AsyncMock
+        ) as mock_create,
+    ):
+        await on_add_subtask(message, message.nlu.intents["add_subtask"], MagicMock())
+
+    mock_subtask.assert_awaited_once()
+    mock_create.assert_not_called()
+
+
 # --- Recurrence and reminder tests ---
 
 
@@ -2465,8 +2466,7 @@ async def test_edit_recurrence_fallback_task_name_with_na() -> None:
 
 
 async def test_edit_remove_recurrence() -> None:
-    task = _make_task(title="Зарядка")
-    task.repeat_flag = "RRULE:FREQ=DAILY"
+    task = _make_task(title="Зарядка").model_copy(update={"repeat_flag": "RRULE:FREQ=DAILY"})
     mock_factory = _make_mock_client(projects=[], tasks=[task])
     client = mock_factory.return_value.__aenter__.return_value
     client.get_inbox_tasks = AsyncMock(return_value=[task])
@@ -2504,8 +2504,7 @@ async def test_edit_add_reminder() -> None:
 
 
 async def test_edit_remove_reminder() -> None:
-    task = _make_task(title="Встреча")
-    task.reminders = ["TRIGGER:-PT30M"]
+    task = _make_task(title="Встреча").model_copy(update={"reminders": ["TRIGGER:-PT30M"]})
     mock_factory = _make_mock_client(projects=[], tasks=[task])
     client = mock_factory.return_value.__aenter__.return_value
     client.get_inbox_tasks = AsyncMock(return_value=[task])
@@ -2859,8 +2858,7 @@ async def test_no_timezone_warning_when_timezone_present(
 
     from alice_ticktick.dialogs.handlers import _get_user_tz
 
-    mock_update = MagicMock()
-    mock_update.meta.timezone = "Europe/Moscow"
+    mock_update = _make_update()
 
     with caplog.at_level(logging.WARNING):
         tz = _get_user_tz(mock_update)
@@ -2894,8 +2892,7 @@ async def test_list_tasks_passes_timezone_to_parse_yandex_datetime() -> None:
         },
     }
 
-    mock_update = MagicMock()
-    mock_update.meta.timezone = "Europe/Moscow"
+    mock_update = _make_update()
 
     response = await handle_list_tasks(message, intent_data, factory, event_update=mock_update)
     # Task due 2026-03-02 00:30 UTC = 2026-03-02 03:30 MSK — should match March 2
@@ -2929,10 +2926,7 @@ async def test_create_task_unauthorized_returns_auth_required() -> None:
     intent_data: dict[str, Any] = {
         "slots": {"task_name": {"type": "YANDEX.STRING", "value": "купить молоко"}}
     }
-    mock_factory = _make_mock_client()
-    mock_factory.return_value.__aenter__ = AsyncMock(
-        side_effect=TickTickUnauthorizedError(401, "Unauthorized"),
-    )
+    mock_factory = _make_failing_client(TickTickUnauthorizedError(401, "Unauthorized"))
     response = await handle_create_task(message, intent_data, mock_factory)
     assert response.text == txt.AUTH_REQUIRED_NO_LINKING
 
@@ -2941,10 +2935,7 @@ async def test_list_tasks_unauthorized_returns_auth_required() -> None:
     """TickTickUnauthorizedError in list_tasks returns AUTH_REQUIRED."""
     message = _make_message()
     intent_data: dict[str, Any] = {"slots": {}}
-    mock_factory = _make_mock_client()
-    mock_factory.return_value.__aenter__ = AsyncMock(
-        side_effect=TickTickUnauthorizedError(401, "Unauthorized"),
-    )
+    mock_factory = _make_failing_client(TickTickUnauthorizedError(401, "Unauthorized"))
     response = await handle_list_tasks(message, intent_data, mock_factory)
     assert response.text == txt.AUTH_REQUIRED_NO_LINKING
 
@@ -2956,10 +2947,7 @@ async def test_complete_task_unauthorized_returns_auth_required() -> None:
     intent_data: dict[str, Any] = {
         "slots": {"task_name": {"type": "YANDEX.STRING", "value": "купить молоко"}}
     }
-    mock_factory = _make_mock_client()
-    mock_factory.return_value.__aenter__ = AsyncMock(
-        side_effect=TickTickUnauthorizedError(401, "Unauthorized"),
-    )
+    mock_factory = _make_failing_client(TickTickUnauthorizedError(401, "Unauthorized"))
     response = await handle_complete_task(message, intent_data, state, mock_factory)
     assert response.text == txt.AUTH_REQUIRED_NO_LINKING
 
@@ -2971,10 +2959,7 @@ async def test_complete_task_generic_exception_returns_api_error() -> None:
     intent_data: dict[str, Any] = {
         "slots": {"task_name": {"type": "YANDEX.STRING", "value": "купить молоко"}}
     }
-    mock_factory = _make_mock_client()
-    mock_factory.return_value.__aenter__ = AsyncMock(
-        side_effect=Exception("API error"),
-    )
+    mock_factory = _make_failing_client()
     response = await handle_complete_task(message, intent_data, state, mock_factory)
     assert response.text == txt.COMPLETE_ERROR
 
@@ -2984,14 +2969,9 @@ async def test_unauthorized_with_account_linking_returns_linking_response() -> N
     message = _make_message()
     intent_data: dict[str, Any] = {"slots": {}}
 
-    mock_update = MagicMock()
-    mock_update.meta.interfaces.account_linking = {}
-    mock_update.meta.timezone = "UTC"
+    mock_update = _make_update(timezone="UTC", account_linking={})
 
-    mock_factory = _make_mock_client()
-    mock_factory.return_value.__aenter__ = AsyncMock(
-        side_effect=TickTickUnauthorizedError(401, "Unauthorized"),
-    )
+    mock_factory = _make_failing_client(TickTickUnauthorizedError(401, "Unauthorized"))
     response = await handle_list_tasks(
         message, intent_data, mock_factory, event_update=mock_update
     )
@@ -3005,10 +2985,7 @@ async def test_delete_confirm_unauthorized_clears_state() -> None:
     state = _make_state(
         {"task_id": "t1", "project_id": "p1", "task_name": "test", "task_context": ""}
     )
-    mock_factory = _make_mock_client()
-    mock_factory.return_value.__aenter__ = AsyncMock(
-        side_effect=TickTickUnauthorizedError(401, "Unauthorized"),
-    )
+    mock_factory = _make_failing_client(TickTickUnauthorizedError(401, "Unauthorized"))
     response = await handle_delete_confirm(message, state, ticktick_client_factory=mock_factory)
     assert response.text == txt.AUTH_REQUIRED_NO_LINKING
     state.clear.assert_awaited()
@@ -3078,17 +3055,64 @@ async def test_delete_task_redirects_to_delete_checklist_item_on_checklist_comma
 
 
 def test_router_overdue_registered_before_list_tasks() -> None:
-    """Verify router source code registers OVERDUE_TASKS before LIST_TASKS."""
-    from pathlib import Path
+    """Verify the router dispatches OVERDUE_TASKS before LIST_TASKS."""
+    from alice_ticktick.dialogs.intents import LIST_TASKS, OVERDUE_TASKS
+    from alice_ticktick.dialogs.router import _INTENT_HANDLERS
+
+    priority = list(_INTENT_HANDLERS)
+    assert OVERDUE_TASKS in priority, "OVERDUE_TASKS not found in router"
+    assert LIST_TASKS in priority, "LIST_TASKS not found in router"
+    assert priority.index(OVERDUE_TASKS) < priority.index(LIST_TASKS), (
+        "OVERDUE_TASKS must be dispatched before LIST_TASKS"
+    )
+
+
+@pytest.mark.parametrize(
+    "intent_name, expected_kwargs",
+    [
+        ("YANDEX.HELP", ()),
+        ("list_projects", ("event_update",)),
+        ("create_task", ("intent_data", "event_update")),
+        ("complete_task", ("intent_data", "state", "event_update")),
+    ],
+)
+def test_router_resolves_handler_kwargs_once(
+    intent_name: str, expected_kwargs: tuple[str, ...]
+) -> None:
+    """Each dispatch route passes only the arguments its handler declares."""
+    from alice_ticktick.dialogs.router import _INTENT_HANDLERS
 
-    router_path = Path(__file__).parent.parent / "alice_ticktick" / "dialogs" / "router.py"
-    source = router_path.read_text()
-    overdue_pos = source.find("IntentFilter(OVERDUE_TASKS)")
-    list_tasks_pos = source.find("IntentFilter(LIST_TASKS)")
+    assert _INTENT_HANDLERS[intent_name].kwargs == expected_kwargs
 
-    assert overdue_pos != -1, "OVERDUE_TASKS not found in router"
-    assert list_tasks_pos != -1, "LIST_TASKS not found in router"
-    assert overdue_pos < list_tasks_pos, "OVERDUE_TASKS must appear before LIST_TASKS in router.py"
+
+@pytest.mark.parametrize(
+    "specific, generic",
+    [
+        ("add_subtask", "create_task"),
+        ("add_checklist_item", "create_task"),
+        ("create_recurring_task", "create_task"),
+        ("add_reminder", "create_task"),
+        ("list_projects", "list_tasks"),
+        ("project_tasks", "list_tasks"),
+        ("list_subtasks", "list_tasks"),
+        ("check_item", "complete_task"),
+        ("show_checklist", "edit_task"),
+        ("delete_checklist_item", "delete_task"),
+    ],
+)
+async def test_router_dispatches_specific_intent_before_generic(
+    specific: str, generic: str
+) -> None:
+    """When NLU fires overlapping intents, the more specific one is dispatched."""
+    from alice_ticktick.dialogs.filters import IntentDispatchFilter
+    from alice_ticktick.dialogs.router import _INTENT_HANDLERS
+
+    message = _make_message(intents={generic: {"slots": {}}, specific: {"slots": {}}})
+
+    result = await IntentDispatchFilter(_INTENT_HANDLERS)(message)
+
+    assert isinstance(result, dict)
+    assert result["intent_name"] == specific
 
 
 # --- on_unknown fallback tests ---
@@ -3174,8 +3198,7 @@ async def test_list_tasks_redirects_to_show_checklist() -> None:
     message.nlu.entities = []
 
     intent_data: dict[str, Any] = {"slots": {"priority": {"value": "чеклист"}}}
-    event_update = MagicMock()
-    event_update.meta.interfaces.account_linking = None
+    event_update = _make_update()
 
     with patch(
         "alice_ticktick.dialogs.router.handle_show_checklist",
@@ -3202,8 +3225,7 @@ async def test_list_tasks_not_redirected_when_no_checklist_keyword() -> None:
     message.nlu.entities = []
 
     intent_data: dict[str, Any] = {"slots": {}}
-    event_update = MagicMock()
-    event_update.meta.interfaces.account_linking = None
+    event_update = _make_update()
 
     with patch(
         "alice_ticktick.dialogs.router.handle_list_tasks",
@@ -3264,9 +3286,7 @@ async def test_create_task_extracts_project_from_utterance() -> None:
             "task_name": {"value": "кктест ревью кода в проекте Inbox"},
         }
     }
-    event_update = MagicMock()
-    event_update.meta.timezone = "Europe/Moscow"
-    event_update.meta.interfaces.account_linking = None
+    event_update = _make_update()
 
     response = await handle_create_task(message, intent_data, client, event_update=event_update)
     assert "Готово" in response.text
@@ -3619,3 +3639,80 @@ class TestTryParseWeekday:
         result = _try_parse_weekday("на понедельник", self.TZ)
         assert result is not None
         assert result > today
+
+
+class TestGatherAllTasks:
+    async def test_cold_fanout_does_not_wait_for_inbox(self) -> None:
+        inbox_release = asyncio.Event()
+        inbox_task = _make_task(task_id="inbox-1", title="Из входящих")
+        project_task = _make_task(task_id="proj-task", title="Из проекта")
+
+        async def slow_inbox() -> list[Task]:
+            await inbox_release.wait()
+            return [inbox_task]
+
+        async def project_tasks(project_id: str) -> list[Task]:
+            # Project fan-out runs while the inbox request is still pending
+            inbox_release.set()
+            return [project_task]
+
+        client = AsyncMock()
+        client.get_projects = AsyncMock(return_value=[_make_project()])
+        client.get_inbox_tasks = slow_inbox
+        client.get_tasks = project_tasks
+
+        tasks = await asyncio.wait_for(_gather_all_tasks(client, "token-cold"), timeout=1)
+        assert tasks == [inbox_task, project_task]
+
+    async def test_inbox_cancelled_when_projects_fail(self) -> None:
+        inbox_started = asyncio.Event()
+        inbox_cancelled = asyncio.Event()
+
+        async def pending_inbox() -> list[Task]:
+            inbox_started.set()
+            try:
+                await asyncio.Event().wait()
+            except asyncio.CancelledError:
+                inbox_cancelled.set()
+                raise
+            return []
+
+        async def failing_projects() -> list[Project]:
+            await inbox_started.wait()
+            raise TickTickUnauthorizedError(401, "unauthorized")
+
+        client = AsyncMock()
+        client.get_projects = failing_projects
+        client.get_inbox_tasks = pending_inbox
+
+        with pytest.raises(TickTickUnauthorizedError):
+            await _gather_all_tasks(client, "token-fail")
+        await asyncio.sleep(0)
+        assert inbox_cancelled.is_set()
+
+    async def test_finished_inbox_error_retrieved_when_projects_fail(self) -> None:
+        import gc
+
+        async def failing_inbox() -> list[Task]:
+            raise TickTickUnauthorizedError(401, "unauthorized")
+
+        async def failing_projects() -> list[Project]:
+            for _ in range(3):  # let the inbox request fail first
+                await asyncio.sleep(0)
+            raise TickTickUnauthorizedError(401, "unauthorized")
+
+        client = AsyncMock()
+        client.get_projects = failing_projects
+        client.get_inbox_tasks = failing_inbox
+
+        loop = asyncio.get_running_loop()
+        reported: list[dict[str, Any]] = []
+        previous = loop.get_exception_handler()
+        loop.set_exception_handler(lambda _loop, context: reported.append(context))
+        try:
+            with pytest.raises(TickTickUnauthorizedError):
+                await _gather_all_tasks(client, "token-inbox-fail")
+            gc.collect()
+        finally:
+            loop.set_exception_handler(previous)
+        assert reported == []
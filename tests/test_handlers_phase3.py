@@ -103,6 +103,14 @@ def _make_mock_client(
     return factory
 
 
+def _make_failing_client() -> MagicMock:
+    """Create a mock TickTickClient factory whose ``async with`` raises an API error."""
+    factory = MagicMock()
+    factory.return_value.__aenter__ = AsyncMock(side_effect=Exception("API error"))
+    factory.return_value.__aexit__ = AsyncMock(return_value=None)
+    return factory
+
+
 def _intent_data(**slots: Any) -> dict[str, Any]:
     """Build intent_data dict from keyword args."""
     return {"slots": {k: {"value": v} for k, v in slots.items()}}
@@ -166,10 +174,7 @@ class TestAddSubtask:
     async def test_api_error_on_fetch(self) -> None:
         message = _make_message()
         data = _intent_data(subtask_name="Подзадача", parent_name="Родитель")
-        mock_factory = _make_mock_client()
-        mock_factory.return_value.__aenter__ = AsyncMock(
-            side_effect=Exception("API error"),
-        )
+        mock_factory = _make_failing_client()
         response = await handle_add_subtask(message, data, mock_factory)
         assert response.text == txt.SUBTASK_ERROR
 
@@ -246,10 +251,7 @@ class TestListSubtasks:
     async def test_api_error(self) -> None:
         message = _make_message()
         data = _intent_data(task_name="тест")
-        mock_factory = _make_mock_client()
-        mock_factory.return_value.__aenter__ = AsyncMock(
-            side_effect=Exception("API error"),
-        )
+        mock_factory = _make_failing_client()
         response = await handle_list_subtasks(message, data, mock_factory)
         assert "Произошла ошибка при обращении к TickTick" in response.text
 
@@ -321,10 +323,7 @@ class TestAddChecklistItem:
     async def test_api_error_on_fetch(self) -> None:
         message = _make_message()
         data = _intent_data(item_name="Молоко", task_name="Список")
-        mock_factory = _make_mock_client()
-        mock_factory.return_value.__aenter__ = AsyncMock(
-            side_effect=Exception("API error"),
-        )
+        mock_factory = _make_failing_client()
         response = await handle_add_checklist_item(message, data, mock_factory)
         assert response.text == txt.CHECKLIST_ITEM_ERROR
 
@@ -393,10 +392,7 @@ class TestShowChecklist:
     async def test_api_error(self) -> None:
         message = _make_message()
         data = _intent_data(task_name="тест")
-        mock_factory = _make_mock_client()
-        mock_factory.return_value.__aenter__ = AsyncMock(
-            side_effect=Exception("API error"),
-        )
+        mock_factory = _make_failing_client()
         response = await handle_show_checklist(message, data, mock_factory)
         assert "Произошла ошибка при обращении к TickTick" in response.text
 
@@ -475,14 +471,15 @@ class TestCheckItem:
         # Verify the other item is unchanged
         other = [i for i in call_args.items if i["title"] == "Хлеб"]
         assert other[0]["status"] == 0
+        assert call_args.items == [
+            {"id": "ci1", "title": "Молоко", "status": 1, "sortOrder": 0},
+            {"id": "ci2", "title": "Хлеб", "status": 0, "sortOrder": 0},
+        ]
 
     async def test_api_error_on_fetch(self) -> None:
         message = _make_message()
         data = _intent_data(item_name="Молоко", task_name="Список")
-        mock_factory = _make_mock_client()
-        mock_factory.return_value.__aenter__ = AsyncMock(
-            side_effect=Exception("API error"),
-        )
+        mock_factory = _make_failing_client()
         response = await handle_check_item(message, data, mock_factory)
         assert response.text == txt.CHECKLIST_CHECK_ERROR
 
@@ -573,10 +570,7 @@ class TestDeleteChecklistItem:
     async def test_api_error_on_fetch(self) -> None:
         message = _make_message()
         data = _intent_data(item_name="Молоко", task_name="Список")
-        mock_factory = _make_mock_client()
-        mock_factory.return_value.__aenter__ = AsyncMock(
-            side_effect=Exception("API error"),
-        )
+        mock_factory = _make_failing_client()
         response = await handle_delete_checklist_item(message, data, mock_factory)
         assert response.text == txt.CHECKLIST_ITEM_DELETE_ERROR
 
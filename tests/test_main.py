@@ -61,6 +61,35 @@ async def test_handler_unknown_command() -> None:
     assert "не распознана" in result["response"]["text"]
 
 
+async def test_handler_dispatches_intent() -> None:
+    event = _make_event(new=False, intents={"YANDEX.HELP": {"slots": {}}})
+    result = await handler(event, None)
+    assert result["response"]["text"].startswith("Я умею")
+
+
+async def test_handler_dispatches_highest_priority_intent() -> None:
+    from aliceio.types import Response
+
+    event = _make_event(
+        new=False,
+        intents={"list_tasks": {"slots": {}}, "overdue_tasks": {"slots": {}}},
+    )
+    with (
+        patch(
+            "alice_ticktick.dialogs.router.handle_overdue_tasks",
+            new_callable=AsyncMock,
+            return_value=Response(text="overdue"),
+        ) as mock_overdue,
+        patch(
+            "alice_ticktick.dialogs.router.handle_list_tasks", new_callable=AsyncMock
+        ) as mock_list,
+    ):
+        result = await handler(event, None)
+    assert result["response"]["text"] == "overdue"
+    mock_overdue.assert_awaited_once()
+    mock_list.assert_not_called()
+
+
 async def test_handler_returns_version() -> None:
     event = _make_event(new=True)
     result = await handler(event, None)
@@ -79,6 +108,23 @@ async def test_handler_error_returns_fallback() -> None:
     assert "ошибка" in result["response"]["text"].lower()
 
 
+async def test_handler_error_fallback_is_fresh_copy() -> None:
+    event = {**_make_event(new=True), "version": "1.1"}
+    with patch(
+        "alice_ticktick.main._process_event",
+        new_callable=AsyncMock,
+        side_effect=Exception("boom"),
+    ):
+        first = await handler(event, None)
+        first["response"]["text"] = "mutated"
+        second = await handler(event, None)
+    assert second["version"] == "1.1"
+    assert second["response"] == {
+        "text": "Произошла внутренняя ошибка. Попробуйте позже.",
+        "end_session": False,
+    }
+
+
 def test_dispatcher_uses_api_storage() -> None:
     """Dispatcher must use Alice API storage to persist FSM state across CF invocations."""
     from aliceio.fsm.middlewares.api_storage import FSMApiStorageMiddleware
@@ -0,0 +1,48 @@
+"""Tests for custom aliceio middlewares."""
+
+from __future__ import annotations
+
+from typing import Any
+from unittest.mock import AsyncMock, MagicMock
+
+from alice_ticktick.dialogs.middlewares import NluIntentsMiddleware, get_nlu_intents
+
+
+class TestNluIntentsMiddleware:
+    async def test_exposes_intents(self) -> None:
+        message = MagicMock()
+        message.nlu.intents = {"create_task": {"slots": {}}}
+        handler = AsyncMock(return_value="ok")
+        data: dict[str, Any] = {}
+
+        result = await NluIntentsMiddleware()(handler, message, data)
+
+        assert result == "ok"
+        assert data["nlu_intents"] == {"create_task": {"slots": {}}}
+        handler.assert_awaited_once_with(message, data)
+
+    async def test_no_nlu(self) -> None:
+        message = MagicMock()
+        message.nlu = None
+        data: dict[str, Any] = {}
+
+        await NluIntentsMiddleware()(AsyncMock(), message, data)
+
+        assert data["nlu_intents"] == {}
+
+
+class TestGetNluIntents:
+    def test_prefers_middleware_intents(self) -> None:
+        message = MagicMock()
+        message.nlu.intents = {"list_tasks": {"slots": {}}}
+        assert get_nlu_intents(message, {}) == {}
+
+    def test_falls_back_to_message(self) -> None:
+        message = MagicMock()
+        message.nlu.intents = {"list_tasks": {"slots": {}}}
+        assert get_nlu_intents(message) == {"list_tasks": {"slots": {}}}
+
+    def test_no_nlu(self) -> None:
+        message = MagicMock()
+        message.nlu = None
+        assert get_nlu_intents(message) == {}
@@ -2,14 +2,20 @@
 
 from __future__ import annotations
 
+import dataclasses
+from datetime import UTC, datetime, timedelta, timezone
 from typing import Any
 
+import pytest
+from pydantic import TypeAdapter, ValidationError
+
 from alice_ticktick.ticktick.models import (
     ChecklistItem,
     Task,
     TaskCreate,
     TaskPriority,
     TaskUpdate,
+    format_ticktick_datetime,
 )
 
 
@@ -35,7 +41,7 @@ class TestChecklistItem:
             "status": 0,
             "sortOrder": 5,
         }
-        item = ChecklistItem.model_validate(data)
+        item = TypeAdapter(ChecklistItem).validate_python(data)
         assert item.id == "item1"
         assert item.title == "Check email"
         assert item.sort_order == 5
@@ -44,6 +50,12 @@ class TestChecklistItem:
         item = ChecklistItem(title="Test", sort_order=10)
         assert item.sort_order == 10
 
+    def test_is_immutable_and_slotted(self) -> None:
+        item = ChecklistItem(title="Test")
+        with pytest.raises(dataclasses.FrozenInstanceError):
+            item.title = "Other"  # type: ignore[misc]
+        assert not hasattr(item, "__dict__")
+
 
 class TestTaskWithItems:
     def test_task_with_items(self) -> None:
@@ -248,3 +260,40 @@ class TestTaskUpdateRepeatAndReminders:
         data = tu.model_dump(by_alias=True, exclude_none=True)
         assert "repeatFlag" not in data
         assert "reminders" not in data
+
+
+class TestTaskUpdateDatetimeSerialization:
+    @pytest.mark.parametrize(
+        ("value", "expected"),
+        [
+            (datetime(2026, 3, 5, 9, 7, 1, tzinfo=UTC), "2026-03-05T09:07:01.000+0000"),
+            (
+                datetime(2026, 3, 5, 23, 59, 59, 999999, tzinfo=timezone(timedelta(hours=3))),
+                "2026-03-05T23:59:59.000+0300",
+            ),
+            (
+                datetime(2026, 1, 1, tzinfo=timezone(timedelta(hours=-5, minutes=-30))),
+                "2026-01-01T00:00:00.000-0530",
+            ),
+            (datetime(2026, 1, 1, 12, 0), "2026-01-01T12:00:00.000"),
+        ],
+    )
+    def test_matches_ticktick_format(self, value: datetime, expected: str) -> None:
+        tu = TaskUpdate(id="t1", project_id="p1", due_date=value, start_date=value)
+        data = tu.model_dump(by_alias=True, exclude_none=True)
+        assert data["dueDate"] == expected
+        assert data["startDate"] == expected
+        assert expected == value.strftime("%Y-%m-%dT%H:%M:%S.000%z")
+        assert format_ticktick_datetime(value) == expected
+
+
+class TestFrozenModels:
+    def test_task_is_immutable(self) -> None:
+        task = Task(id="t1", project_id="p1", title="Buy milk")
+        with pytest.raises(ValidationError):
+            task.title = "Other"  # type: ignore[misc]
+
+    def test_update_payload_is_immutable(self) -> None:
+        tu = TaskUpdate(id="t1", project_id="p1")
+        with pytest.raises(ValidationError):
+            tu.title = "Other"  # type: ignore[misc]
@@ -0,0 +1,32 @@
+"""Tests for the shared Russian pluralization helper."""
+
+import pytest
+
+from alice_ticktick.dialogs.nlp._plural import pluralize
+
+_FORMS = ("день", "дня", "дней")
+
+
+@pytest.mark.parametrize(
+    "n, expected",
+    [
+        (0, "0 дней"),
+        (1, "1 день"),
+        (2, "2 дня"),
+        (4, "4 дня"),
+        (5, "5 дней"),
+        (11, "11 дней"),
+        (12, "12 дней"),
+        (14, "14 дней"),
+        (21, "21 день"),
+        (22, "22 дня"),
+        (101, "101 день"),
+        (111, "111 дней"),
+        (112, "112 дней"),
+        (1024, "1024 дня"),
+        (-1, "-1 день"),
+        (-12, "-12 дней"),
+    ],
+)
+def test_pluralize(n: int, expected: str) -> None:
+    assert pluralize(n, _FORMS) == expected
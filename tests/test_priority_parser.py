@@ -66,3 +66,13 @@ class TestEdgeCases:
 
     def test_whitespace_only_returns_none(self) -> None:
         assert parse_priority("   ") is None
+
+
+class TestTaskPriorityMapping:
+    def test_every_parsed_value_maps_to_enum(self) -> None:
+        from alice_ticktick.dialogs.handlers.tasks import _PRIORITY_BY_VALUE
+        from alice_ticktick.dialogs.nlp.priority_parser import _PRIORITY_MAP
+        from alice_ticktick.ticktick.models import TaskPriority
+
+        for value in set(_PRIORITY_MAP.values()):
+            assert _PRIORITY_BY_VALUE[value] is TaskPriority(value)
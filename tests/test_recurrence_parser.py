@@ -1,8 +1,14 @@
 """Tests for recurrence NLU slot → RRULE parser."""
 
+import logging
+
 import pytest
 
-from alice_ticktick.dialogs.nlp.recurrence_parser import build_rrule, format_recurrence
+from alice_ticktick.dialogs.nlp.recurrence_parser import (
+    build_rrule,
+    format_recurrence,
+    match_freq_keyword,
+)
 
 
 class TestBuildRrule:
@@ -92,6 +98,18 @@ class TestBuildRrule:
     def test_case_insensitive(self) -> None:
         assert build_rrule(rec_freq="День") == "RRULE:FREQ=DAILY"
 
+    def test_uppercase_and_whitespace(self) -> None:
+        assert build_rrule(rec_freq="  ПЯТНИЦУ ") == "RRULE:FREQ=WEEKLY;BYDAY=FR"
+
+    def test_interval_one_is_omitted(self) -> None:
+        assert build_rrule(rec_freq="день", rec_interval=1) == "RRULE:FREQ=DAILY"
+
+    def test_interval_with_byday(self) -> None:
+        assert (
+            build_rrule(rec_freq="Понедельник", rec_interval=2)
+            == "RRULE:FREQ=WEEKLY;INTERVAL=2;BYDAY=MO"
+        )
+
 
 class TestFormatRecurrence:
     """Tests for format_recurrence: RRULE → human-readable Russian."""
@@ -119,9 +137,25 @@ class TestFormatRecurrence:
     def test_format(self, rrule: str, expected: str) -> None:
         assert format_recurrence(rrule) == expected
 
+    @pytest.mark.parametrize(
+        "rrule, expected",
+        [
+            ("FREQ=DAILY;INTERVAL=2", "каждые 2 дня"),
+            ("RRULE:INTERVAL=3;FREQ=WEEKLY", "каждые 3 недели"),
+            ("RRULE:FREQ=WEEKLY;WKST=MO;BYDAY=TH", "каждый четверг"),
+            ("RRULE:FREQ=MONTHLY;;BYMONTHDAY=1;", "каждое 1 число"),
+        ],
+    )
+    def test_format_component_order_and_extras(self, rrule: str, expected: str) -> None:
+        assert format_recurrence(rrule) == expected
+
     def test_unknown_rrule(self) -> None:
         assert format_recurrence("RRULE:FREQ=SECONDLY") == "повторяется"
 
+    def test_large_interval_and_multi_day(self) -> None:
+        assert format_recurrence("RRULE:FREQ=DAILY;INTERVAL=45") == "каждые 45 дней"
+        assert format_recurrence("RRULE:FREQ=WEEKLY;BYDAY=MO,WE") == "каждую неделю"
+
     def test_none_returns_none(self) -> None:
         assert format_recurrence(None) is None
 
@@ -144,3 +178,56 @@ class TestBuildRruleFirstWordFallback:
     def test_single_recognized_word_works(self) -> None:
         """Single recognized word still works."""
         assert build_rrule(rec_freq="ежедневно") == "RRULE:FREQ=DAILY"
+
+    def test_fallback_logged_on_every_call(self, caplog: pytest.LogCaptureFixture) -> None:
+        """The fallback warning is not swallowed for repeated inputs."""
+        with caplog.at_level(logging.WARNING):
+            for _ in range(2):
+                assert (
+                    build_rrule(rec_freq="будни работать")
+                    == "RRULE:FREQ=WEEKLY;BYDAY=MO,TU,WE,TH,FR"
+                )
+        assert sum("first-word fallback" in r.message for r in caplog.records) == 2
+
+
+class TestRecurrenceCache:
+    """Repeated inputs are served from the LRU cache."""
+
+    def test_format_recurrence_cached(self) -> None:
+        from alice_ticktick.dialogs.nlp.recurrence_parser import _format_recurrence_impl
+
+        _format_recurrence_impl.cache_clear()
+        format_recurrence("RRULE:FREQ=DAILY;INTERVAL=4")
+        format_recurrence("RRULE:FREQ=DAILY;INTERVAL=4")
+        info = _format_recurrence_impl.cache_info()
+        assert (info.hits, info.misses) == (1, 1)
+
+
+def test_lookup_maps_are_read_only() -> None:
+    from alice_ticktick.dialogs.nlp.recurrence_parser import _BYDAY_TO_RU, _FREQ_MAP
+
+    with pytest.raises(TypeError):
+        _FREQ_MAP["квартал"] = ("MONTHLY", None)  # type: ignore[index]
+    with pytest.raises(TypeError):
+        _BYDAY_TO_RU["XX"] = "никогда"  # type: ignore[index]
+
+
+class TestMatchFreqKeyword:
+    """Tests for match_freq_keyword: leading recurrence keyword via trie."""
+
+    @pytest.mark.parametrize(
+        "text, expected",
+        [
+            ("день", ("день", "DAILY", None)),
+            ("дней пить воду", ("дней", "DAILY", None)),
+            ("будний день", ("будний", "WEEKLY", "MO,TU,WE,TH,FR")),
+            ("будни", ("будни", "WEEKLY", "MO,TU,WE,TH,FR")),
+            ("пятницу\tв офисе", ("пятницу", "WEEKLY", "FR")),
+        ],
+    )
+    def test_match(self, text: str, expected: tuple[str, str, str | None]) -> None:
+        assert match_freq_keyword(text) == expected
+
+    @pytest.mark.parametrize("text", ["", "дн", "деньги", "годовой отчёт", "пить воду день"])
+    def test_no_match(self, text: str) -> None:
+        assert match_freq_keyword(text) is None
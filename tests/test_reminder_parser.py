@@ -85,8 +85,34 @@ class TestFormatReminder:
     def test_format(self, trigger: str, expected: str) -> None:
         assert format_reminder(trigger) == expected
 
+    @pytest.mark.parametrize(
+        "trigger, expected",
+        [
+            ("TRIGGER:PT15M", "за 15 минут"),
+            ("TRIGGER:-PT1H30M", "за 1 час"),
+            ("TRIGGER:-PT10S", "напоминание"),
+            ("TRIGGER:-P2", "напоминание"),
+            ("TRIGGER:-PT", "напоминание"),
+            ("VALARM:-PT5M", "напоминание"),
+        ],
+    )
+    def test_format_edge_cases(self, trigger: str, expected: str) -> None:
+        assert format_reminder(trigger) == expected
+
     def test_unknown_trigger(self) -> None:
         assert format_reminder("TRIGGER:UNKNOWN") == "напоминание"
 
     def test_none(self) -> None:
         assert format_reminder(None) is None
+
+    def test_repeated_trigger_cached(self) -> None:
+        first = format_reminder("TRIGGER:-PT45M")
+        assert first == "за 45 минут"
+        assert format_reminder("TRIGGER:-PT45M") is first
+
+
+def test_unit_map_is_read_only() -> None:
+    from alice_ticktick.dialogs.nlp.reminder_parser import _UNIT_MAP
+
+    with pytest.raises(TypeError):
+        _UNIT_MAP["неделю"] = "W"  # type: ignore[index]
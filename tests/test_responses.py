@@ -1,10 +1,14 @@
 """Tests for alice_ticktick.dialogs.responses utility functions."""
 
+import pytest
+
+from alice_ticktick.dialogs import responses as txt
 from alice_ticktick.dialogs.responses import api_error_detail
 from alice_ticktick.ticktick.client import (
     TickTickRateLimitError,
     TickTickServerError,
 )
+from tests.e2e import expected_responses
 
 
 class TestApiErrorDetail:
@@ -36,3 +40,12 @@ class TestApiErrorDetail:
         assert "код 500" in result
         assert "Internal" not in result
         assert "Попробуйте позже" in result
+
+
+@pytest.mark.parametrize(
+    "name",
+    [name for name in vars(expected_responses) if name.isupper()],
+)
+def test_e2e_expected_responses_match_source(name: str) -> None:
+    """The e2e copy of response strings must not drift from responses.py."""
+    assert getattr(expected_responses, name) == getattr(txt, name)
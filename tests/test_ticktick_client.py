@@ -1,5 +1,6 @@
 """Tests for TickTick API v1 client."""
 
+import asyncio
 import json
 from typing import Any
 from unittest.mock import AsyncMock, patch
@@ -124,6 +125,16 @@ class TestGetTasks:
 
             assert tasks == []
 
+    @pytest.mark.asyncio
+    async def test_ignores_other_project_data_fields(self) -> None:
+        data = {"project": SAMPLE_PROJECT, "tasks": [SAMPLE_TASK], "columns": []}
+        async with TickTickClient(access_token="t") as client:
+            mock = AsyncMock(return_value=_make_response(json_data=data))
+            with patch.object(client._client, "request", mock):
+                tasks = await client.get_tasks("proj1")
+
+            assert [t.id for t in tasks] == ["task1"]
+
 
 class TestGetTask:
     """Test get_task method."""
@@ -164,7 +175,8 @@ class TestCreateTask:
             mock.assert_called_once_with(
                 "POST",
                 "/task",
-                json={"title": "New task", "projectId": "proj1", "content": "", "priority": 0},
+                content=b'{"title":"New task","projectId":"proj1","content":"","priority":0}',
+                headers={"Content-Type": "application/json"},
             )
 
     @pytest.mark.asyncio
@@ -214,7 +226,8 @@ class TestUpdateTask:
             mock.assert_called_once_with(
                 "POST",
                 "/task/task1",
-                json={"id": "task1", "projectId": "proj1", "title": "Updated title"},
+                content=b'{"id":"task1","projectId":"proj1","title":"Updated title"}',
+                headers={"Content-Type": "application/json"},
             )
 
     @pytest.mark.asyncio
@@ -241,7 +254,8 @@ class TestUpdateTask:
             mock.assert_called_once_with(
                 "POST",
                 "/task/task1",
-                json={"id": "task1", "projectId": "proj1", "priority": 5},
+                content=b'{"id":"task1","projectId":"proj1","priority":5}',
+                headers={"Content-Type": "application/json"},
             )
 
 
@@ -258,7 +272,12 @@ class TestCreateProject:
 
             assert project.id == "proj-new"
             assert project.name == "Travel"
-            mock.assert_called_once_with("POST", "/project", json={"name": "Travel"})
+            mock.assert_called_once_with(
+                "POST",
+                "/project",
+                content=b'{"name":"Travel"}',
+                headers={"Content-Type": "application/json"},
+            )
 
 
 class TestDeleteTask:
@@ -289,7 +308,8 @@ class TestMoveTask:
             mock.assert_called_once_with(
                 "POST",
                 "/task/move",
-                json=[{"taskId": "task1", "fromProjectId": "proj-from", "toProjectId": "proj-to"}],
+                content=b'[{"taskId":"task1","fromProjectId":"proj-from","toProjectId":"proj-to"}]',
+                headers={"Content-Type": "application/json"},
             )
 
     @pytest.mark.asyncio
@@ -493,6 +513,97 @@ class TestRetryOnRateLimit:
             sleep_mock.assert_any_call(1.0)
             sleep_mock.assert_any_call(2.0)
 
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize(
+        ("retry_after", "expected_delay"),
+        [
+            ("3", 3.0),
+            ("0.5", 0.5),
+            ("120", 5.0),
+            ("Wed, 21 Oct 2026 07:28:00 GMT", 1.0),
+            ("nan", 1.0),
+            ("inf", 1.0),
+        ],
+    )
+    async def test_retry_honors_retry_after(self, retry_after: str, expected_delay: float) -> None:
+        rate_resp = httpx.Response(
+            status_code=429,
+            headers={"Retry-After": retry_after},
+            content=b"Rate Limited",
+            request=httpx.Request("GET", f"{BASE_URL}/test"),
+        )
+        ok_resp = _make_response(json_data=[SAMPLE_PROJECT])
+        async with TickTickClient(access_token="t") as client:
+            mock = AsyncMock(side_effect=[rate_resp, ok_resp])
+            sleep_mock = AsyncMock()
+            with (
+                patch.object(client._client, "request", mock),
+                patch("alice_ticktick.ticktick.client.asyncio.sleep", sleep_mock),
+            ):
+                await client.get_projects()
+
+            sleep_mock.assert_called_once_with(expected_delay)
+
+
+class TestConcurrencyLimit:
+    """Test that concurrent requests are bounded per client."""
+
+    @pytest.mark.asyncio
+    async def test_requests_bounded(self) -> None:
+        from alice_ticktick.ticktick.client import _MAX_CONCURRENT_REQUESTS
+
+        in_flight = 0
+        peak = 0
+
+        async def fake_request(*args: Any, **kwargs: Any) -> httpx.Response:
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0)
+            in_flight -= 1
+            return _make_response(json_data=[SAMPLE_PROJECT])
+
+        async with TickTickClient(access_token="t") as client:
+            with patch.object(client._client, "request", side_effect=fake_request):
+                await asyncio.gather(
+                    *(client.get_projects() for _ in range(_MAX_CONCURRENT_REQUESTS * 3))
+                )
+
+        assert peak == _MAX_CONCURRENT_REQUESTS
+
+    @pytest.mark.asyncio
+    async def test_limit_not_shared_between_clients(self) -> None:
+        from alice_ticktick.ticktick.client import _MAX_CONCURRENT_REQUESTS
+
+        in_flight = 0
+        peak = 0
+        release = asyncio.Event()
+
+        async def fake_request(*args: Any, **kwargs: Any) -> httpx.Response:
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await release.wait()
+            in_flight -= 1
+            return _make_response(json_data=[SAMPLE_PROJECT])
+
+        first = TickTickClient(access_token="a")
+        second = TickTickClient(access_token="b")
+        with patch.object(first._client, "request", side_effect=fake_request):
+            pending = asyncio.gather(
+                *(
+                    c.get_projects()
+                    for c in (first, second)
+                    for _ in range(_MAX_CONCURRENT_REQUESTS)
+                )
+            )
+            for _ in range(100):  # let every request that can start reach the fake
+                await asyncio.sleep(0)
+            release.set()
+            await pending
+
+        assert peak == 2 * _MAX_CONCURRENT_REQUESTS
+
 
 class TestContextManager:
     """Test async context manager."""